@@ -0,0 +1,71 @@
+"""Bytes and seconds each tool's clone strategy saves over a full clone.
+
+    python3 benchmarks/clone.py [TOOL|URL ...] [--strategy STRATEGY]
+
+Each repository is cloned twice through netrunner.mirror, each time into an
+empty mirror cache: once in full and once with the strategy its catalog
+clone step asks for (or --strategy, or NETRUNNER_CLONE_STRATEGY). "bytes"
+is what ends up on disk in the mirror and the checkout's .git, about what
+was fetched. Without arguments the largest repositories of the catalog are
+measured, which needs the network.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from netrunner import catalog, mirror
+
+LARGE = ["nmap", "setoolkit", "routersploit"]
+
+
+def clone_step(screens, name):
+    if "://" in name or os.path.isdir(name):
+        return {"clone": name}
+    for step in screens[name]["choices"]["1"][1]:
+        if isinstance(step, dict) and "clone" in step:
+            return step
+    raise SystemExit(name + " clones nothing")
+
+
+def measure(url, strategy, sparse=None):
+    work = tempfile.mkdtemp(prefix="netrunner-clone-")
+    os.environ["NETRUNNER_MIRROR_DIR"] = os.path.join(work, "mirrors")
+    checkout = os.path.join(work, "checkout")
+    try:
+        with open(os.devnull, "w") as log:
+            start = time.perf_counter()
+            status = mirror.clone(url, checkout, strategy, sparse, log)
+            seconds = time.perf_counter() - start
+        if status:
+            raise SystemExit("cloning {0} failed (exit {1})".format(url, status))
+        return mirror.size(os.environ["NETRUNNER_MIRROR_DIR"]) + mirror.size(os.path.join(checkout, ".git")), seconds
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    p.add_argument("tools", nargs="*", default=LARGE, metavar="TOOL|URL")
+    p.add_argument("--strategy", choices=sorted(mirror.OPTIONS))
+    args = p.parse_args()
+    screens = catalog.load()
+    print("{0:<16} {1:<8} {2:>10} {3:>10} {4:>10} {5:>8} {6:>8} {7:>8}".format(
+        "tool", "strategy", "full MB", "MB", "saved MB", "full s", "s", "saved s"))
+    for name in args.tools:
+        step = clone_step(screens, name)
+        strategy = args.strategy or step.get("strategy") or ("partial" if step.get("sparse") else mirror.STRATEGY)
+        full_bytes, full_seconds = measure(step["clone"], "full")
+        used_bytes, used_seconds = measure(step["clone"], strategy, step.get("sparse"))
+        print("{0:<16} {1:<8} {2:>10.2f} {3:>10.2f} {4:>10.2f} {5:>8.2f} {6:>8.2f} {7:>8.2f}".format(
+            os.path.basename(name.rstrip("/")), strategy + ("+sparse" if step.get("sparse") else ""),
+            full_bytes / 1e6, used_bytes / 1e6, (full_bytes - used_bytes) / 1e6,
+            full_seconds, used_seconds, full_seconds - used_seconds))
+
+
+if __name__ == "__main__":
+    main()
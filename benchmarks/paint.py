@@ -0,0 +1,88 @@
+"""Per-screen paint time of Netrunner's menus and tool screens.
+
+    python3 benchmarks/paint.py [ROUNDS]
+
+Every screen of the catalog is drawn into /dev/null: its banner or
+description box, coloured, in one write. "native" draws with
+netrunner.render on every paint; "cached" is a repeat visit served from the
+render cache; "external" is the old figlet/boxes/lolcat pipelines and only
+runs when those programs are installed. "fork floor" is `printf | cat |
+cat` through the shell, what any two-stage pipeline costs before figlet or
+lolcat do any work.
+"""
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from netrunner import catalog, render
+
+
+def screen(spec, banner=render.draw_banner, box=render.draw_box):
+    parts = []
+    if spec["type"] == "menu":
+        parts.append(render.CLEAR)
+        if spec["title"]:
+            parts.append(banner(spec["title"], render.columns()))
+        parts.append(spec["listing"])
+    elif "description" in spec:
+        parts.append(box(spec["description"], spec.get("style", "boy")))
+    return parts
+
+
+def cached_screen(spec):
+    return screen(spec, render.banner, render.box)
+
+
+def fork_floor(spec):
+    render.external("printf '%s\\n' x | cat | cat")
+    return []
+
+
+def measure(screens, paint, rounds, out):
+    times = {}
+    for name, spec in screens.items():
+        best = None
+        for _ in range(rounds):
+            start = time.perf_counter()
+            render.paint(*paint(spec), out=out)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        times[name] = best * 1000
+    return times
+
+
+def report(label, times, screens):
+    menus = [ms for name, ms in times.items() if screens[name]["type"] == "menu"]
+    tools = [ms for name, ms in times.items() if screens[name]["type"] == "tool"]
+    print("{0:<12} {1:>10.3f} {2:>10.3f} {3:>10.3f}".format(label, statistics.median(menus), statistics.median(tools), max(times.values())))
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    screens = catalog.load()
+    runs = [("native", screen, "native"), ("cached", cached_screen, "native")]
+    if all(shutil.which(program) for program in ("figlet", "boxes", "lolcat")):
+        runs.append(("external", screen, "external"))
+    else:
+        print("figlet/boxes/lolcat not installed: skipping the external renderer")
+    runs.append(("fork floor", fork_floor, "native"))
+    print("{0:<12} {1:>10} {2:>10} {3:>10}".format("ms/screen", "menu", "tool", "worst"))
+    with tempfile.TemporaryDirectory() as home, open(os.devnull, "w") as out:
+        os.environ["NETRUNNER_HOME"] = home
+        for label, paint, renderer in runs:
+            render.RENDERER = renderer
+            report(label, measure(screens, paint, rounds, out), screens)
+        render._cache.clear()
+        start = time.perf_counter()
+        render.load_cache(render.columns())
+        print("render cache: {0} entries, {1} bytes, loaded in {2:.3f} ms".format(
+            len(render._cache["drawn"]), os.path.getsize(render._cache["target"]), (time.perf_counter() - start) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Time from starting Netrunner to its first prompt, against a budget.
+
+    python3 benchmarks/startup.py [--budget MS] [--rounds N]
+
+Netrunner.py is started under -X importtime with a fresh tools directory
+(NETRUNNER_HOME), and timed until the main menu's prompt reaches its
+output. The first start, which writes the state database, the render cache
+and the .pyc files, is not counted; the best of the rounds after it is.
+The modules that took longest to import are listed, and the exit status is
+1 when the best start is over the budget (NETRUNNER_STARTUP_BUDGET, 60 ms
+by default), so the check can run in CI.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROMPT = "=>> ".encode("utf-8")
+
+
+def start(home):
+    # (milliseconds to the prompt, the -X importtime report)
+    with tempfile.TemporaryFile() as report:
+        began = time.perf_counter()
+        process = subprocess.Popen([sys.executable, "-X", "importtime", os.path.join(ROOT, "Netrunner.py")],
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=report,
+                                   env=dict(os.environ, NETRUNNER_HOME=home))
+        seen = b""
+        while PROMPT not in seen:
+            chunk = process.stdout.read1(65536)
+            if not chunk:
+                raise SystemExit("Netrunner exited before its first prompt:\n" + seen.decode("utf-8", "replace"))
+            seen += chunk
+        elapsed = (time.perf_counter() - began) * 1000
+        process.kill()
+        process.wait()
+        report.seek(0)
+        return elapsed, report.read().decode("utf-8", "replace")
+
+
+def imports(report):
+    # [(cumulative microseconds, module)] of the top-level imports.
+    found = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            found.append((int(cumulative), name.strip()))
+    return sorted(found, reverse=True)
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    p.add_argument("--budget", type=float, default=float(os.environ.get("NETRUNNER_STARTUP_BUDGET", "60")), help="milliseconds (default %(default)s)")
+    p.add_argument("--rounds", type=int, default=5)
+    args = p.parse_args()
+    with tempfile.TemporaryDirectory() as home:
+        start(home)
+        runs = [start(home) for _ in range(args.rounds)]
+    best, report = min(runs)
+    print("first prompt after {0:.1f} ms (best of {1}, median {2:.1f} ms), budget {3:.0f} ms".format(
+        best, args.rounds, sorted(ms for ms, _ in runs)[len(runs) // 2], args.budget))
+    print("\nslowest imports (cumulative ms):")
+    for microseconds, name in imports(report)[:10]:
+        print("  {0:8.2f}  {1}".format(microseconds / 1000, name))
+    if best > args.budget:
+        print("\nover budget by {0:.1f} ms".format(best - args.budget))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
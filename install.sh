@@ -39,7 +39,7 @@ echo -e "${WHITE}              [1] Kali Linux / Parrot-Os "
 echo -e "${WHITE}              [0] Exit "
 echo -n -e "几乇ㄒ尺ㄩ几几乇尺  >> "
 read choice
-INSTALL_DIR="/usr/share/doc/Netrunner"
+INSTALL_DIR="/opt/Netrunner"
 BIN_DIR="/usr/bin/"
 if [ $choice == 1 ]; then 
 	echo "[*] Checking Internet Connection .."
@@ -60,13 +60,13 @@ if [ $choice == 1 ]; then
 	    fi
     		echo "[✔] Installing ...";
 		echo "";
-		git clone https://github.com/MiChaelinzo/CyberPunkNetrunner.git "$INSTALL_DIR";
-		echo "#!/bin/bash
-		python3 $INSTALL_DIR/Netrunner.py" '${1+"$@"}' > Netrunner;
-		sudo chmod +x Netrunner;
-		sudo cp Netrunner /usr/bin/;
-		rm Netrunner;
-		echo ""; 
+		# Installed as the first version under $INSTALL_DIR (see
+		# netrunner/selfupdate.py), which also writes /usr/bin/Netrunner.
+		TMP_DIR=$(mktemp -d)
+		git clone --depth 1 https://github.com/MiChaelinzo/CyberPunkNetrunner.git "$TMP_DIR";
+		(cd "$TMP_DIR" && NETRUNNER_ROOT="$INSTALL_DIR" NETRUNNER_SOURCE="$TMP_DIR" python3 -m netrunner.selfupdate);
+		rm -rf "$TMP_DIR";
+		echo "";
 		echo "[✔] Trying to installing Requirements ..."
 		sudo pip3 install lolcat
 		sudo apt-get install -y figlet
@@ -0,0 +1,241 @@
+"""A cache of what tools build from source.
+
+The executor hands every build command a step runs, ./configure, make,
+make install and direct gcc, cc, g++ or clang calls, to cached() before
+starting it. Each one is keyed by the source tree it runs in (the commit
+of its git checkout, any changes to tracked files and the names of the
+untracked ones, such as earlier build outputs), the compiler's
+version, CC, CXX and the *FLAGS, the command itself and the build commands
+before it in the same step. On a miss it runs, make with -j<CPUs> unless
+it is installing or already says, through ccache when ccache is installed,
+and what it changed is kept under .netrunner/builds/<key>: the files it
+wrote in the checkout and, for make install, what it installed. make
+install runs with DESTDIR pointing at a scratch tree, which is kept and
+then copied onto / with `cp -a`, so the entry holds what that command
+installed and nothing that apt or another tool wrote meanwhile. A Makefile
+that ignores DESTDIR installs straight into place and is not cached. On a
+hit those files are put back and the command does not run, so installing
+a tool again, or running one that compiles itself on every run, costs a
+copy. Every build command, hit or miss, is recorded with how long it took
+in the builds table of the state database.
+
+Commands outside a git checkout and steps that go through /bin/sh are not
+cached. NETRUNNER_BUILD_CACHE=off turns the cache off, NETRUNNER_CCACHE=off
+ccache, and NETRUNNER_BUILD_JOBS sets make's -j.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+
+from netrunner import executor, paths
+
+ENABLED = os.environ.get("NETRUNNER_BUILD_CACHE", "on") != "off"
+CCACHE = os.environ.get("NETRUNNER_CCACHE", "on") != "off"
+JOBS = int(os.environ.get("NETRUNNER_BUILD_JOBS", "0")) or os.cpu_count() or 1
+FORMAT = 2
+COMPILER = re.compile(r"(gcc|cc|g\+\+|c\+\+|clang|clang\+\+)(-[\d.]+)?$")
+FLAGS = ("CC", "CXX", "CFLAGS", "CXXFLAGS", "CPPFLAGS", "LDFLAGS")
+MANIFEST = "manifest.json"
+VERSIONS = {}
+
+
+def cache_dir():
+    return os.environ.get("NETRUNNER_BUILD_CACHE_DIR") or paths.data_path("builds")
+
+
+def kind(words):
+    # "configure", "make", "install" or "compile"; None for the rest.
+    name = os.path.basename(words[0]) if words else ""
+    if name == "configure":
+        return "configure"
+    if name in ("make", "gmake"):
+        return "install" if "install" in words[1:] else "make"
+    if COMPILER.match(name):
+        return "compile"
+    return None
+
+
+def unprivileged(argv):
+    # (sudo and its options, the command); sudo is dropped when we are
+    # root already, so the command keeps our environment.
+    at = executor.after_sudo(argv)
+    if at and hasattr(os, "geteuid") and os.geteuid() == 0:
+        return [], argv[at:]
+    return argv[:at], argv[at:]
+
+
+def git(cwd, args):
+    found = subprocess.run(["git", "-C", cwd] + args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    return found.stdout if found.returncode == 0 else None
+
+
+def source_tree(cwd, outputs=()):
+    # (checkout, hash of its state), or None outside git. outputs: files,
+    # relative to cwd, the command is going to write whatever is there.
+    top = git(cwd, ["rev-parse", "--show-toplevel"])
+    tree = git(cwd, ["rev-parse", "HEAD^{tree}"])
+    if not top or not tree:
+        return None
+    top = top.decode().strip()
+    changes = git(cwd, ["diff", "HEAD", "--binary"]) or b""
+    skip = {os.path.relpath(os.path.join(cwd, name), top) for name in outputs}
+    untracked = [name for name in (git(top, ["ls-files", "--others", "-z"]) or b"").decode("utf-8", "replace").split("\0") if name and name not in skip]
+    return top, hashlib.sha256(tree + changes + "\0".join(sorted(untracked)).encode("utf-8")).hexdigest()
+
+
+def compiler(env):
+    name = env.get("CC") or "cc"
+    if name not in VERSIONS:
+        try:
+            found = subprocess.run(name.split() + ["--version"], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL, text=True)
+            VERSIONS[name] = found.stdout.split("\n")[0]
+        except OSError:
+            VERSIONS[name] = ""
+    return VERSIONS[name]
+
+
+def snapshot(top):
+    # {path: (size, mtime)} of the files in a checkout, .git aside.
+    found = {}
+    for root, dirs, files in os.walk(top):
+        if root == top and ".git" in dirs:
+            dirs.remove(".git")
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            found[os.path.relpath(path, top)] = (st.st_size, st.st_mtime_ns)
+    return found
+
+
+def listed(root):
+    # The files of a tree, relative to it.
+    found = []
+    for directory, dirs, files in os.walk(root):
+        found.extend(os.path.relpath(os.path.join(directory, name), root) for name in files)
+        found.extend(os.path.relpath(os.path.join(directory, name), root) for name in dirs if os.path.islink(os.path.join(directory, name)))
+    return sorted(found)
+
+
+def faster(argv, what, env):
+    # (argv, env) of a build that is going to run.
+    if what == "make" and not any(word.startswith("-j") or word == "--jobs" or word.startswith("--jobs=") for word in argv):
+        argv = argv[:1] + ["-j{0}".format(JOBS)] + argv[1:]
+    if CCACHE and shutil.which("ccache"):
+        if what == "compile":
+            argv = ["ccache"] + argv
+        elif what in ("configure", "make"):
+            env = dict(env or os.environ)
+            env["CC"] = "ccache " + env.get("CC", "cc")
+            env["CXX"] = "ccache " + env.get("CXX", "c++")
+    return argv, env
+
+
+def copy(source, target):
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    if os.path.lexists(target):
+        os.remove(target)
+    if os.path.islink(source):
+        os.symlink(os.readlink(source), target)
+    else:
+        # A fresh mtime, so make sees the outputs as newer than the sources.
+        shutil.copy(source, target)
+
+
+def save(entry, top, written, staged, manifest):
+    tmp = "{0}.{1}".format(entry, os.getpid())
+    shutil.rmtree(tmp, ignore_errors=True)
+    for name in written:
+        copy(os.path.join(top, name), os.path.join(tmp, "tree", name))
+    installed = listed(staged) if staged else []
+    if installed:
+        shutil.copytree(staged, os.path.join(tmp, "root"), symlinks=True)
+    manifest = dict(manifest, tree=written, installed=installed)
+    paths.write_file(os.path.join(tmp, MANIFEST), json.dumps(manifest, indent=1).encode("utf-8"))
+    shutil.rmtree(entry, ignore_errors=True)
+    os.replace(tmp, entry)
+
+
+def placing(tree, target="/"):
+    # The cp that copies an installed tree onto target: what is in it, not
+    # the tree itself, whose mode and owner cp -a would give target.
+    return ["cp", "-a"] + [os.path.join(tree, name) for name in sorted(os.listdir(tree))] + [target]
+
+
+def restore(entry, top, manifest, place):
+    # place(tree): the status of copying an installed tree onto /.
+    for name in manifest["tree"]:
+        copy(os.path.join(entry, "tree", name), os.path.join(top, name))
+    return place(os.path.join(entry, "root")) if manifest["installed"] else 0
+
+
+def cached(argv, cwd, env, chain, start, note):
+    # An executor wrapper: the status of a build command, from the cache or
+    # by start(argv, env), or None for commands it does not cache.
+    sudo, words = unprivileged(argv)
+    what = kind(words)
+    # What a compiler is told to write is there from the last time.
+    outputs = [words[i + 1] for i in range(len(words) - 1) if words[i] == "-o"] if what == "compile" else []
+    found = ENABLED and what and source_tree(cwd, outputs)
+    if not found:
+        return None
+    from netrunner import state
+    top, tree = found
+    flags = {name: (env or os.environ).get(name) for name in FLAGS}
+    version = compiler(env or os.environ)
+    key = hashlib.sha256(json.dumps([FORMAT, tree, os.path.relpath(cwd, top), version, flags, words, chain]).encode()).hexdigest()
+    chain.append(key)
+    entry = os.path.join(cache_dir(), key[:2], key)
+    began = time.time()
+
+    def place(tree):
+        # With sudo when the command had it: the prefixes are root's.
+        return start(sudo + placing(tree), env)
+
+    try:
+        with open(os.path.join(entry, MANIFEST)) as f:
+            manifest = json.load(f)
+        if restore(entry, top, manifest, place) == 0:
+            note("build cache: reused {0} ({1:.1f}s saved)".format(" ".join(words), manifest["seconds"]))
+            state.compiled(top, " ".join(words), key, began, time.time() - began, 0, True)
+            return 0
+    except (OSError, ValueError, KeyError):
+        pass
+    before = snapshot(top)
+    command, env = faster(words, what, env)
+    staged = None
+    if what == "install":
+        os.makedirs(cache_dir(), exist_ok=True)
+        staged = tempfile.mkdtemp(prefix="destdir.", dir=cache_dir())
+        command = command + ["DESTDIR=" + staged]
+    try:
+        status = start(sudo + command, env)
+        if status == 0 and staged and not listed(staged):
+            # The Makefile ignored DESTDIR and installed in place: there is
+            # nothing to keep, and nothing left to do.
+            staged = None
+            key = None
+        elif status == 0 and staged:
+            status = place(staged)
+        seconds = time.time() - began
+        if status == 0 and key:
+            after = snapshot(top)
+            written = sorted(name for name, stat in after.items() if before.get(name) != stat)
+            try:
+                save(entry, top, written, staged, {"command": words, "seconds": round(seconds, 3), "compiler": version, "created": time.time()})
+            except OSError:
+                # A full disk or a file we cannot read: the build still counts.
+                pass
+    finally:
+        if staged:
+            shutil.rmtree(staged, ignore_errors=True)
+    state.compiled(top, " ".join(words), key, began, seconds, status, False)
+    return status
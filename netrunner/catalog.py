@@ -0,0 +1,235 @@
+"""Menus and tools of Netrunner, loaded from catalog.json.
+
+catalog.json is the file to edit when adding a tool. The first load compiles
+it into a flat screen table (dispatch dicts and prompts already built) and
+keeps that as a marshal image in __pycache__, so later startups read one
+small binary file instead of parsing JSON or importing code.
+
+Inside that image each category's tools are marshalled on their own. The
+menus unmarshal only the menus at startup and a category's tools on the
+first visit to one of them (screen()), keeping them for the rest of the
+session; load() returns every screen, for the command line and netrunnerd.
+
+Every screen also has paths from the main menu, made of the menu numbers or
+screen ids on the way to it: "1.11", "info/striker" and "01/striker" all
+lead to Striker. They are worked out with the rest and kept in the image,
+so link() finds a screen, and the menus it sits under, in one lookup.
+"""
+import marshal
+import os
+import sys
+
+from netrunner import paths
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(HERE, "catalog.json")
+ROOT = "menu"
+FORMAT = 8
+# Screens Netrunner draws itself; menus can list them like any other.
+BUILTIN = {"jobs": {"type": "jobs", "id": "jobs", "name": "Jobs"}}
+LOADED = {}
+# Steps that read a repository's history need a full clone of it.
+HISTORY = r"\bgit\s+(log|describe|blame|bisect|tag|reset|revert|cherry-pick|merge-base|fetch --unshallow)\b"
+
+
+def choice_key(choice):
+    # "01", "1" and " 1 " all pick the same entry; "00" is "0".
+    choice = choice.strip()
+    if not choice:
+        return ""
+    return choice.lstrip("0") or "0"
+
+
+def clone_target(steps):
+    # (url, directory) of the first clone in a tool's install steps.
+    from netrunner import mirror
+    for step in steps:
+        if isinstance(step, dict) and "clone" in step:
+            return step["clone"], step.get("dir") or mirror.checkout_name(step["clone"])
+    return None, None
+
+
+def full_history(spec):
+    # Install steps with the tool's clones given a full clone when the
+    # tool's steps need history and the catalog did not pick a strategy.
+    steps = spec.get("install", []) + spec.get("run", [])
+    for action in spec.get("actions", []):
+        steps = steps + action["steps"]
+    import re
+    if not any(isinstance(step, str) and re.search(HISTORY, step) for step in steps):
+        return spec["install"]
+    return [dict(step, strategy="full") if isinstance(step, dict) and "clone" in step and "strategy" not in step else step for step in spec["install"]]
+
+
+def compile_catalog(data):
+    screens = {name: dict(spec) for name, spec in BUILTIN.items()}
+    category = {}
+    for name, spec in data["menus"].items():
+        listing = []
+        choices = {}
+        for key, label, target in spec["items"]:
+            listing.append("    [{0}] {1}".format(key, label))
+            choices[choice_key(key)] = target
+            if target in data["tools"]:
+                category.setdefault(target, name)
+        listing.append("    [99] {0}".format(spec["back"]))
+        screens[name] = {
+            "type": "menu",
+            "id": name,
+            "name": spec.get("name", "Netrunner"),
+            "title": spec.get("title"),
+            "logo": spec.get("logo", False),
+            "listing": "\n".join(listing) + "\n",
+            "choices": choices,
+            "items": [(key, target) for key, label, target in spec["items"]],
+            "root": name == ROOT,
+            "limits": spec.get("limits"),
+        }
+    for name, spec in data["tools"].items():
+        actions = []
+        if "install" in spec:
+            actions.append(("Install", "install", full_history(spec), "back"))
+        if "run" in spec:
+            actions.append((spec.get("run_label", "Run"), "run", spec["run"], "stay"))
+        for action in spec.get("actions", []):
+            actions.append((action["label"], action["label"].lower(), action["steps"], action.get("then", "stay")))
+        choices = {}
+        prompt = []
+        for number, (label, kind, steps, then) in enumerate(actions, 1):
+            choices[str(number)] = (kind, steps, then)
+            prompt.append("[{0}]{1}".format(number, label))
+        prompt.append("[99]Back >> ")
+        screen = dict(spec)
+        repo, directory = clone_target(spec.get("install", []))
+        screen.update({
+            "type": "tool",
+            "id": name,
+            "category": category.get(name),
+            "repo": repo,
+            "dir": directory,
+            "prompt": " ".join(prompt),
+            "choices": choices,
+        })
+        screens[name] = screen
+    return screens
+
+
+def compiled_path(source):
+    base = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(os.path.dirname(source), "__pycache__", base + ".marshal")
+
+
+def stamp(source=SOURCE):
+    # Changes whenever catalog.json is edited; caches built from the
+    # catalog keep it to know when they are stale.
+    st = os.stat(source)
+    return (FORMAT, marshal.version, st.st_mtime_ns, st.st_size)
+
+
+def split(screens):
+    # (menus, {tool: category}, {category: its tools, marshalled}); tools
+    # no menu lists are the "" category.
+    menus = {}
+    index = {}
+    sections = {}
+    for name, spec in screens.items():
+        if spec["type"] != "tool":
+            menus[name] = spec
+            continue
+        index[name] = spec["category"] or ""
+        sections.setdefault(index[name], {})[name] = spec
+    return menus, index, {category: marshal.dumps(tools) for category, tools in sections.items()}
+
+
+def links(menus):
+    # {"1.11": ["menu", "info", "striker"], "info.striker": ...}: each path
+    # to a screen, as the stack of screens that shows it.
+    found = {}
+    pending = [("", [ROOT])]
+    while pending:
+        path, stack = pending.pop()
+        for key, target in menus[stack[-1]]["items"]:
+            if target in stack:
+                continue
+            for step in (choice_key(key), target):
+                link = path + "." + step if path else step
+                found[link] = stack + [target]
+                if target in menus and menus[target]["type"] == "menu":
+                    pending.append((link, stack + [target]))
+    return found
+
+
+def compiled(source=SOURCE):
+    # {"stamp", "menus", "index", "sections", "links", "opened", "all"}:
+    # "opened" keeps the categories unmarshalled so far, "all" load()'s
+    # result.
+    current = stamp(source)
+    # A process that loads the catalog again, such as netrunnerd, keeps it.
+    if source in LOADED and LOADED[source]["stamp"] == current:
+        return LOADED[source]
+    target = compiled_path(source)
+    try:
+        with open(target, "rb") as f:
+            cached_stamp, menus, index, sections, linked = marshal.loads(f.read())
+        if cached_stamp != current:
+            raise ValueError("stale")
+    except (OSError, EOFError, ValueError, TypeError):
+        import json
+        with open(source, encoding="utf-8") as f:
+            menus, index, sections = split(compile_catalog(json.load(f)))
+        linked = links(menus)
+        try:
+            paths.write_file(target, marshal.dumps((current, menus, index, sections, linked)))
+        except OSError:
+            # Read-only install: keep working from the JSON.
+            pass
+    LOADED[source] = {"stamp": current, "menus": menus, "index": index, "sections": sections, "links": linked,
+                      "opened": {}, "all": None}
+    return LOADED[source]
+
+
+def section(name, source=SOURCE):
+    # The tools of one category, unmarshalled on first use.
+    found = compiled(source)
+    if name not in found["opened"]:
+        found["opened"][name] = marshal.loads(found["sections"][name])
+    return found["opened"][name]
+
+
+def menus(source=SOURCE):
+    return compiled(source)["menus"]
+
+
+def screen(name, source=SOURCE):
+    # KeyError for a screen the catalog does not have.
+    found = compiled(source)
+    if name in found["menus"]:
+        return found["menus"][name]
+    return section(found["index"][name], source)[name]
+
+
+def link(path, source=SOURCE):
+    # The stack of screens a path leads to, or None: a copy, as the menus
+    # push on and pop off the stack they are given.
+    steps = path.strip().strip("./").lower().replace("/", ".").split(".")
+    found = compiled(source)["links"].get(".".join(choice_key(step) if step.isdigit() else step for step in steps))
+    return list(found) if found else None
+
+
+def load(source=SOURCE):
+    found = compiled(source)
+    if found["all"] is None:
+        screens = dict(found["menus"])
+        for name in found["sections"]:
+            screens.update(section(name, source))
+        found["all"] = screens
+    return found["all"]
+
+
+def tools(screens):
+    return [name for name, spec in screens.items() if spec["type"] == "tool"]
+
+
+if __name__ == "__main__":
+    screens = load(sys.argv[1] if len(sys.argv) > 1 else SOURCE)
+    print("{0} screens compiled ({1} tools)".format(len(screens), len(tools(screens))))
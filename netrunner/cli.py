@@ -0,0 +1,344 @@
+"""Netrunner without the menus, for scripts and provisioning.
+
+    Netrunner install sherlock sqlmap dalfox
+    Netrunner install --category info --category forensic --jobs 8
+    Netrunner install --category wire --plan
+    Netrunner run sherlock --set uname=johndoe
+    Netrunner update --all --jobs 8
+    Netrunner list --installed --json
+    Netrunner status
+    Netrunner wheelhouse [--category info]
+    Netrunner self-update [--rollback]
+
+Commands run the same catalog steps as the menus but never prompt: answers
+to a tool's questions come from --set, and the commands a tool runs get
+/dev/null as their input. With --json the tools' own output goes to stderr
+and stdout carries one JSON document. Installs are compiled into one plan
+(a single apt transaction, a single pip run, parallel clones) and log to
+.netrunner/logs/. What is installed, at which commit, comes from the state
+database the installs and runs keep up to date; update fast-forwards the
+clones in place and skips those whose remote has not moved. self-update
+updates Netrunner itself (see selfupdate.py). wheelhouse builds the wheels
+of the tools' Python requirements, all of them by default, into the local
+wheelhouse that pip installs then use (see wheelhouse.py). When netrunnerd
+is running, install, update, list and status run in it (see daemon.py).
+
+Exit status: 0 when everything succeeded, 1 when a tool failed, 2 for
+usage errors such as an unknown tool or a missing --set answer.
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+from netrunner import catalog, installer, paths, plan, selfupdate, state, steps, updater, venvs, wheelhouse
+
+OK = 0
+FAILED = 1
+USAGE = 2
+# Set by netrunnerd when it runs the commands: a function describing it.
+DAEMON = None
+
+
+class UsageError(Exception):
+    pass
+
+
+def parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json", action="store_true", help="print the result as JSON on stdout")
+    answers = argparse.ArgumentParser(add_help=False)
+    answers.add_argument("--set", action="append", default=[], metavar="NAME=VALUE", help="answer one of the tool's questions")
+    p = argparse.ArgumentParser(prog="Netrunner", description="Install, run, update and list Netrunner tools. Without a command Netrunner opens its menus.", epilog="exit status: 0 when everything succeeded, 1 when a tool failed, 2 for usage errors")
+    commands = p.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+    install = commands.add_parser("install", parents=[common, answers], help="install tools, several at a time")
+    install.add_argument("tools", nargs="*", metavar="TOOL")
+    install.add_argument("--category", action="append", default=[], help="every tool of this menu, e.g. info or forensic")
+    install.add_argument("-j", "--jobs", type=int, default=installer.JOBS, help="install steps run at the same time (default %(default)s)")
+    install.add_argument("--plan", action="store_true", help="print the install plan and stop")
+    run = commands.add_parser("run", parents=[common, answers], help="run a tool")
+    run.add_argument("tool", metavar="TOOL")
+    run.add_argument("--action", default="run", help="another action of the tool, e.g. hide or extract")
+    update = commands.add_parser("update", parents=[common], help="pull the latest version of installed tools")
+    update.add_argument("tools", nargs="*", metavar="TOOL")
+    update.add_argument("--all", action="store_true", help="update every installed tool")
+    update.add_argument("-j", "--jobs", type=int, default=installer.JOBS, help="tools updated at the same time (default %(default)s)")
+    update.add_argument("--rebuild", action="store_true", help="run the install steps again of tools whose commit changed")
+    listing = commands.add_parser("list", parents=[common], help="list tools")
+    listing.add_argument("--installed", action="store_true", help="only tools that are installed")
+    listing.add_argument("--category", help="only tools of this menu, e.g. info or forensic")
+    commands.add_parser("status", parents=[common], help="what is installed, and what netrunnerd is doing")
+    wheels = commands.add_parser("wheelhouse", parents=[common], help="build the wheels of the tools' Python requirements, for offline installs")
+    wheels.add_argument("tools", nargs="*", metavar="TOOL")
+    wheels.add_argument("--category", action="append", default=[], help="every tool of this menu, e.g. info or forensic")
+    itself = commands.add_parser("self-update", parents=[common], help="update Netrunner itself")
+    itself.add_argument("--rollback", action="store_true", help="go back to the version before the last update")
+    return p
+
+
+def lookup(screens, names):
+    unknown = [name for name in names if screens.get(name, {}).get("type") != "tool"]
+    if unknown:
+        raise UsageError("unknown tool: " + ", ".join(unknown))
+    return [screens[name] for name in names]
+
+
+def category(screens, names):
+    tools = []
+    for name in names:
+        if screens.get(name, {}).get("type") != "menu":
+            raise UsageError("unknown category: " + name)
+        # Built-in helpers such as Host To IP have nothing to install.
+        tools.extend(target for key, target in screens[name]["items"] if screens[target]["type"] == "tool" and "install" in screens[target])
+    return tools
+
+
+def parse_answers(pairs):
+    answers = {}
+    for pair in pairs:
+        name, sep, value = pair.partition("=")
+        if not sep:
+            raise UsageError("--set expects NAME=VALUE, got " + pair)
+        answers[name] = value
+    return answers
+
+
+def choose(spec, kind):
+    for action, action_steps, then in spec["choices"].values():
+        if action == kind:
+            return action_steps
+    raise UsageError("{0} has no {1} action".format(spec["id"], kind))
+
+
+def describe(spec, row):
+    return {
+        "tool": spec["id"],
+        "name": spec["name"],
+        "category": spec["category"],
+        "repo": spec["repo"],
+        "path": row["path"] if row else None,
+        "installed": state.is_installed(row),
+        "version": state.version(row),
+        "last_run": row["last_run"] if row else None,
+    }
+
+
+def perform(spec, action, action_steps, answers):
+    start = time.time()
+    status = steps.run(action_steps, answers, check=True, venv=venvs.for_tool(spec))
+    state.ran(spec["id"], status)
+    return {"tool": spec["id"], "action": action, "ok": status == 0, "status": status, "seconds": round(time.time() - start, 3)}
+
+
+@contextlib.contextmanager
+def detached(to_stderr):
+    # Tools read /dev/null instead of waiting on a prompt; with --json their
+    # output also moves to stderr so stdout stays parseable.
+    if DAEMON:
+        # netrunnerd has no terminal and its commands log to files.
+        yield
+        return
+    sys.stdout.flush()
+    saved = [os.dup(0), os.dup(1)]
+    null = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null, 0)
+    os.close(null)
+    if to_stderr:
+        os.dup2(2, 1)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved[0], 0)
+        os.dup2(saved[1], 1)
+        for fd in saved:
+            os.close(fd)
+
+
+def install(args, screens):
+    answers = parse_answers(args.set)
+    names = args.tools + category(screens, args.category)
+    if not names:
+        raise UsageError("name the tools to install or pass --category")
+    jobs = []
+    for spec in lookup(screens, sorted(set(names), key=names.index)):
+        action_steps = choose(spec, "install")
+        missing = [name for name in steps.questions(action_steps) if name not in answers]
+        if missing:
+            raise UsageError("{0} needs --set {1}=...".format(spec["id"], missing[0]))
+        jobs.append((spec, action_steps))
+    compiled = plan.build(jobs)
+    if args.plan:
+        return compiled
+    out = sys.stderr if args.json else sys.stdout
+
+    def progress(done, count, total):
+        print("[{0}/{1}] {2}".format(count, total, outcome(done)), file=out, flush=True)
+
+    start = time.time()
+    with detached(args.json):
+        results = installer.run_plan(compiled, args.jobs, progress)
+    if not args.json:
+        summary(results, time.time() - start)
+    return results
+
+
+def summary(results, elapsed):
+    ok = [done for done in results if done["ok"]]
+    slowest = max(results, key=lambda done: done["seconds"])
+    print("\ninstalled {0}/{1} tools in {2:.1f}s (slowest: {3} {4:.1f}s, {5:.1f}s of work)".format(
+        len(ok), len(results), elapsed, slowest["tool"], slowest["seconds"], sum(done["seconds"] for done in results)))
+    for done in results:
+        if not done["ok"]:
+            print("\n{0}\n  failed at: {1}\n  log: {2}".format(outcome(done), done["failed"], done["log"]))
+            for line in installer.tail(done["log"]):
+                print("  | " + line)
+
+
+def run(args, screens):
+    answers = parse_answers(args.set)
+    spec, = lookup(screens, [args.tool])
+    action_steps = choose(spec, args.action.lower())
+    missing = [name for name in steps.questions(action_steps) if name not in answers]
+    if missing:
+        raise UsageError("{0} needs --set {1}=...".format(spec["id"], missing[0]))
+    if state.not_installed(spec, action_steps):
+        raise UsageError("{0} is not installed: run `Netrunner install {0}` first".format(spec["id"]))
+    with detached(args.json):
+        return [perform(spec, args.action.lower(), action_steps, answers)]
+
+
+def update(args, screens):
+    if args.all:
+        specs = updater.installed(screens)
+    elif args.tools:
+        specs = lookup(screens, args.tools)
+    else:
+        raise UsageError("name the tools to update or pass --all")
+    for spec in specs:
+        if not spec["dir"] or not os.path.isdir(spec["dir"]):
+            raise UsageError("{0} is not installed from git here".format(spec["id"]))
+    out = sys.stderr if args.json else sys.stdout
+
+    def progress(done, count, total):
+        print("[{0}/{1}] {2}".format(count, total, outcome(done)), file=out, flush=True)
+
+    start = time.time()
+    with detached(args.json):
+        results = updater.update(specs, args.jobs, args.rebuild, progress)
+    if not args.json:
+        print(updater.summary(results, time.time() - start))
+    return results
+
+
+def list_tools(args, screens):
+    rows = state.tools()
+    tools = [describe(screens[name], rows.get(name)) for name in catalog.tools(screens)]
+    if args.category:
+        tools = [tool for tool in tools if tool["category"] == args.category]
+    if args.installed:
+        tools = [tool for tool in tools if tool["installed"]]
+    return tools
+
+
+def status(args, screens):
+    rows = state.tools()
+    tools = catalog.tools(screens)
+    marks = [state.is_installed(rows.get(name)) for name in tools]
+    return {
+        "version": selfupdate.version("current"),
+        "tools_dir": paths.tools_dir(),
+        "tools": len(tools),
+        "installed": marks.count(True),
+        "failed": marks.count(False),
+        "daemon": DAEMON() if DAEMON else None,
+    }
+
+
+def build_wheelhouse(args, screens):
+    names = args.tools + category(screens, args.category) or [name for name in catalog.tools(screens) if "install" in screens[name]]
+    jobs = [(spec, choose(spec, "install")) for spec in lookup(screens, sorted(set(names), key=names.index))]
+    out = sys.stderr if args.json else sys.stdout
+
+    def progress(done, count, total):
+        print("[{0}/{1}] {2}".format(count, total, outcome(done)), file=out, flush=True)
+
+    with detached(args.json):
+        results = wheelhouse.build(jobs, progress)
+    if not args.json:
+        print("\n{0} of {1} tools have their wheels in {2}".format(
+            sum(done["ok"] for done in results), len(results), wheelhouse.wheelhouse_dir() or paths.data_path("wheelhouse")))
+    return results
+
+
+def self_update(args, screens):
+    try:
+        result = selfupdate.rollback() if args.rollback else selfupdate.update()
+    except (selfupdate.UpdateError, OSError) as e:
+        return [{"ok": False, "error": str(e)}]
+    return [dict(result, ok=True)]
+
+
+COMMANDS = {"install": install, "run": run, "update": update, "list": list_tools, "status": status, "wheelhouse": build_wheelhouse, "self-update": self_update}
+MARKS = {True: "✔", False: "✘", None: "-"}
+
+
+def report(args, result):
+    if args.command == "install" and args.plan:
+        print(json.dumps({"plan": result}, indent=2) if args.json else plan.describe(result))
+    elif args.json:
+        key = {"list": "tools", "status": "status"}.get(args.command, "results")
+        print(json.dumps({key: result}, indent=2))
+    elif args.command == "status":
+        daemon = result["daemon"]
+        print("Netrunner {0}".format(result["version"] or "(not installed with self-update)"))
+        print("tools: {0} of {1} installed, {2} failed, in {3}".format(result["installed"], result["tools"], result["failed"], result["tools_dir"]))
+        if not daemon:
+            print("netrunnerd: not running")
+        else:
+            print("netrunnerd: pid {0}, up {1}s, {2} commands served".format(daemon["pid"], daemon["uptime"], daemon["served"]))
+            for argv in daemon["running"]:
+                print("  running: Netrunner " + " ".join(argv))
+    elif args.command == "self-update":
+        for done in result:
+            print(selfupdate.describe(done) if done["ok"] else "Netrunner: update failed, nothing was changed: " + done["error"])
+    elif args.command == "list":
+        for tool in result:
+            print("{0} {1:<20} {2:<30} {3}".format(MARKS[tool["installed"]], tool["tool"], tool["name"], tool["version"] or ""))
+    elif args.command == "run":
+        for done in result:
+            print(outcome(done))
+
+
+def outcome(done):
+    status = "ok" if done["ok"] else "failed (exit {0})".format(done["status"])
+    return "{0} {1} {2}: {3} in {4:.1f}s".format(MARKS[done["ok"]], done["action"], done["tool"], status, done["seconds"])
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    screens = catalog.load()
+    home = paths.tools_dir()
+    os.makedirs(home, exist_ok=True)
+    os.chdir(home)
+    state.adopt(screens)
+    try:
+        result = COMMANDS[args.command](args, screens)
+    except UsageError as e:
+        if args.json:
+            print(json.dumps({"error": str(e)}))
+        print("Netrunner: " + str(e), file=sys.stderr)
+        return USAGE
+    try:
+        report(args, result)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Our output was closed, as by `| head`: nothing left to say.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return FAILED
+    if args.command in ("list", "status") or getattr(args, "plan", False):
+        return OK
+    return OK if all(done["ok"] for done in result) else FAILED
@@ -0,0 +1,57 @@
+"""Handing a command to netrunnerd, when it is running.
+
+Netrunner.py calls forward() before it imports anything else, so when the
+daemon (see daemon.py) answers, a command costs an interpreter start and a
+round trip on its socket and nothing more. This module stays small for
+that reason: it imports only what it needs to talk to the socket.
+"""
+import json
+import os
+import socket
+import sys
+
+from netrunner import paths
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Commands the daemon can run; the others need this terminal.
+SERVED = {"install", "update", "list", "status"}
+
+
+def socket_path():
+    return paths.data_path("netrunnerd.sock")
+
+
+def forward(argv):
+    # Exits with the command's status when netrunnerd ran it; returns when
+    # there is no daemon, it runs another version of Netrunner, or the
+    # command is not one it runs.
+    if not argv or argv[0] not in SERVED:
+        return
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_path())
+    except OSError:
+        connection.close()
+        return
+    try:
+        connection.sendall((json.dumps({"argv": argv, "root": HERE}) + "\n").encode("utf-8"))
+        for line in connection.makefile("rb"):
+            message = json.loads(line)
+            if "out" in message:
+                sys.stdout.write(message["out"])
+                sys.stdout.flush()
+            elif "err" in message:
+                sys.stderr.write(message["err"])
+                sys.stderr.flush()
+            elif "exit" in message:
+                sys.exit(message["exit"])
+            elif "stale" in message:
+                return
+    except BrokenPipeError:
+        # Our output was closed, as by `| head`.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    finally:
+        connection.close()
+    print("Netrunner: netrunnerd went away before the command finished", file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,146 @@
+"""netrunnerd: Netrunner's commands answered by a process already running.
+
+    netrunnerd                     (python3 -m netrunner.daemon)
+
+The daemon loads the catalog once, then listens on
+.netrunner/netrunnerd.sock in the tools directory. `Netrunner install`,
+`update`, `list` and `status` hand their arguments to it (see client.py)
+and print what it sends back, so they answer in milliseconds instead of
+starting Netrunner from scratch. Commands from every terminal run in this
+one process, side by side on threads, so they share its package manager
+lock and mirror cache; each still opens the state database for as long as
+it reads or writes it (see state.transaction()). `Netrunner status` shows
+what it is running. Interrupting a client does not stop its command.
+
+Only these one-shot commands go through the daemon. Jobs started from the
+menus (see jobs.py) still belong to the Netrunner that started them: other
+terminals cannot list or attach them, and they end with it.
+
+The daemon uses its own environment, not the client's. A client of
+another Netrunner version, for instance after a self-update, runs its
+command itself. Without the daemon every command works as before.
+"""
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+
+from netrunner import catalog, cli, client, state
+
+LOCAL = threading.local()
+STARTED = time.time()
+# The commands running now, by thread.
+RUNNING = {}
+SERVED = [0]
+
+
+class Stream:
+    # Stands in for sys.stdout or sys.stderr: what a command prints goes to
+    # the client that sent it.
+    def __init__(self, name, fallback):
+        self.name = name
+        self.fallback = fallback
+
+    def write(self, text):
+        send = getattr(LOCAL, "send", None)
+        if send is None:
+            return self.fallback.write(text)
+        send({self.name: text})
+        return len(text)
+
+    def flush(self):
+        if getattr(LOCAL, "send", None) is None:
+            self.fallback.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.fallback, name)
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        lock = threading.Lock()
+
+        def send(message):
+            # A client that went away leaves the command running.
+            try:
+                with lock:
+                    self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+                    self.wfile.flush()
+            except OSError:
+                pass
+
+        if request.get("root") != client.HERE:
+            send({"stale": True})
+            return
+        LOCAL.send = send
+        RUNNING[threading.get_ident()] = request["argv"]
+        try:
+            status = cli.main(request["argv"])
+        except SystemExit as e:
+            # argparse, for --help and usage errors.
+            status = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception:
+            sys.stderr.write(traceback.format_exc())
+            status = cli.FAILED
+        finally:
+            del RUNNING[threading.get_ident()]
+            SERVED[0] += 1
+            LOCAL.send = None
+        send({"exit": status})
+
+
+def info():
+    # Called by `Netrunner status`, which leaves itself out.
+    running = [argv for thread, argv in RUNNING.items() if thread != threading.get_ident()]
+    return {"pid": os.getpid(), "uptime": round(time.time() - STARTED), "served": SERVED[0], "running": running}
+
+
+def listening(path):
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def main(argv=None):
+    path = client.socket_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if listening(path):
+        print("netrunnerd is already running on " + path, file=sys.stderr)
+        return 1
+    if os.path.exists(path):
+        os.remove(path)
+    null = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null, 0)
+    os.close(null)
+    state.adopt(catalog.load())
+    server = socketserver.ThreadingUnixStreamServer(path, Handler)
+    server.daemon_threads = True
+    os.chmod(path, 0o600)
+    sys.stdout = Stream("out", sys.stdout)
+    sys.stderr = Stream("err", sys.stderr)
+    cli.DAEMON = info
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown).start())
+    print("netrunnerd listening on " + path, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""Running the commands of catalog steps, without a shell in between.
+
+A shell step such as `cd sherlock && sudo python3 sherlock {uname}` is
+split into its commands here and each one is started directly as an argv
+list: `cd` becomes the cwd of the commands after it, `&&` and `;` keep
+their meaning, and an answer such as {uname} always fills exactly one
+argument, whatever it contains. Only steps that need the shell's own
+features (globs, variables, pipes, redirections) still go through /bin/sh,
+as one process for the whole step.
+
+With a log file the command's output goes to the log and to a ring buffer
+of its last lines, its input is /dev/null, and it runs in a process group
+of its own so a timeout or cancel() stops all of it. Without a log it has
+the terminal, as tools that draw menus and ask questions need; Ctrl-C then
+stops the tool and not Netrunner, as it did under os.system().
+
+Every command ends in a result: its exit status, how long it took, whether
+it timed out and the last lines it printed. Functions in HOOKS are called
+with each result. Functions in REWRITES are called with each command's
+argv, cwd and environment before it starts and return the argv to start
+instead, as venvs.py and wheelhouse.py do for python and pip. Functions
+in WRAPPERS may run a command themselves, as builds.py does to answer
+builds from its cache: they get the command, the keys of the commands
+they handled earlier in the step, a function that starts it with a given
+argv and environment, and one that prints a note, and return its exit
+status, or None to leave it to the next.
+"""
+import collections
+import os
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+# Lines of output kept in a result.
+RING = 200
+# Seconds a command with a log may run; 0 for no limit.
+TIMEOUT = float(os.environ.get("NETRUNNER_TIMEOUT", "0"))
+PLACEHOLDER = re.compile(r"\{\w+\}")
+NEEDS_SHELL = re.compile(r"[$`*?~<>|(){}\[\]\\!#]")
+BUILTINS = {"export", "source", ".", "exit", "alias", "set", "unset", "ulimit", "umask", "eval", "exec", "read", "wait", "trap", "pushd", "popd"}
+# sudo options that take a value, as in `sudo -u tools pip install ...`.
+SUDO_VALUES = {"-u", "-g", "-h", "-p", "-C", "-D", "-r", "-t", "-T", "-U", "--user", "--group", "--host", "--prompt",
+               "--close-from", "--chdir", "--role", "--type", "--command-timeout", "--other-user"}
+ASSIGNMENT = re.compile(r"\w+=")
+HOOKS = []
+REWRITES = []
+WRAPPERS = []
+# Running commands, and whether each has a process group of its own.
+RUNNING = {}
+
+
+def parse(command):
+    # [(connector, words)] of a step, connector being how the command is
+    # joined to the one before it ("&&" or ";"), or None when the step
+    # needs a shell.
+    if NEEDS_SHELL.search(PLACEHOLDER.sub("", command)):
+        return None
+    commands = []
+    words = []
+    word = None
+    connector = ";"
+    quote = None
+    i = 0
+    while i < len(command):
+        char = command[i]
+        if quote:
+            if char == quote:
+                quote = None
+            else:
+                word.append(char)
+        elif char in "'\"":
+            quote = char
+            word = word if word is not None else []
+        elif char.isspace() or char == ";" or command.startswith("&&", i):
+            if word is not None:
+                words.append("".join(word))
+                word = None
+            if not char.isspace():
+                if words:
+                    commands.append((connector, words))
+                words = []
+                connector = ";" if char == ";" else "&&"
+                i += len(connector)
+                continue
+        elif char == "&":
+            return None
+        else:
+            word = word if word is not None else []
+            word.append(char)
+        i += 1
+    if quote:
+        return None
+    if word is not None:
+        words.append("".join(word))
+    if words:
+        commands.append((connector, words))
+    if any(words[0] in BUILTINS for connector, words in commands):
+        return None
+    return commands
+
+
+def after_sudo(argv):
+    # Where the command itself starts in argv: past `sudo`, its options and
+    # the variables it sets, or 0 without sudo.
+    if argv[:1] != ["sudo"]:
+        return 0
+    at = 1
+    while at < len(argv) and (argv[at].startswith("-") or ASSIGNMENT.match(argv[at])):
+        if argv[at] == "--":
+            return at + 1
+        at += 2 if argv[at] in SUDO_VALUES else 1
+    return min(at, len(argv))
+
+
+def script(command, answers=None):
+    # The commands to start for a step, each argv with its answers filled.
+    commands = parse(command)
+    if commands is None:
+        return [(";", ["/bin/sh", "-c", command.format(**answers) if answers else command])]
+    if answers:
+        return [(connector, [word.format(**answers) for word in words]) for connector, words in commands]
+    return commands
+
+
+def stream(pipe, log, ring):
+    pending = ""
+    for chunk in iter(lambda: pipe.read1(65536), b""):
+        text = chunk.decode("utf-8", "replace")
+        log.write(text)
+        log.flush()
+        lines = (pending + text).split("\n")
+        pending = lines.pop()
+        ring.extend(lines)
+    if pending:
+        ring.append(pending)
+
+
+def stop(process, group):
+    try:
+        if group:
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+        process.wait(5)
+    except subprocess.TimeoutExpired:
+        if group:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def say(message, log, ring):
+    print(message, file=log if log is not None else sys.stderr)
+    ring.append(message)
+
+
+def execute(argv, cwd, deadline, log, ring, env=None):
+    # Exit status of one command; one that runs out of time ends with 124,
+    # as under timeout(1).
+    quiet = log is not None
+    try:
+        process = subprocess.Popen(argv, cwd=cwd, stdin=subprocess.DEVNULL if quiet else None,
+                                   stdout=subprocess.PIPE if quiet else None, stderr=subprocess.STDOUT if quiet else None,
+                                   start_new_session=quiet, env=env)
+    except FileNotFoundError:
+        say("{0}: not found".format(argv[0]), log, ring)
+        return 127
+    except PermissionError:
+        say("{0}: permission denied".format(argv[0]), log, ring)
+        return 126
+    RUNNING[process] = quiet
+    reader = None
+    if quiet:
+        reader = threading.Thread(target=stream, args=(process.stdout, log, ring), daemon=True)
+        reader.start()
+    interrupt = None
+    if not quiet and threading.current_thread() is threading.main_thread():
+        interrupt = signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        process.wait(None if deadline is None else max(0, deadline - time.time()))
+        status = process.returncode
+    except subprocess.TimeoutExpired:
+        stop(process, quiet)
+        status = 124
+    finally:
+        RUNNING.pop(process, None)
+        if interrupt is not None:
+            signal.signal(signal.SIGINT, interrupt)
+    if reader:
+        reader.join()
+        process.stdout.close()
+    return 128 - status if status < 0 else status
+
+
+def run(command, answers=None, cwd=None, timeout=None, log=None, env=None):
+    # Runs one shell step, in env or our own environment, and returns its
+    # result.
+    start = time.time()
+    if timeout is None and log is not None:
+        timeout = TIMEOUT
+    deadline = start + timeout if timeout else None
+    ring = collections.deque(maxlen=RING)
+    cwd = cwd or os.getcwd()
+    if log is not None:
+        log.write("$ " + command + "\n")
+        log.flush()
+    status = 0
+    chain = []
+    for connector, argv in script(command, answers):
+        if connector == "&&" and status:
+            continue
+        if argv[0] == "cd":
+            target = os.path.join(cwd, argv[1]) if len(argv) > 1 else os.path.expanduser("~")
+            status = 0 if os.path.isdir(target) else 2
+            if status:
+                say("cd: can't cd to " + target, log, ring)
+            else:
+                cwd = os.path.normpath(target)
+            continue
+        for rewrite in REWRITES:
+            argv = rewrite(argv, cwd, env)
+        status = None
+        for wrapper in WRAPPERS:
+            status = wrapper(argv, cwd, env, chain, lambda argv, env: execute(argv, cwd, deadline, log, ring, env),
+                             lambda message: say(message, log, ring))
+            if status is not None:
+                break
+        if status is None:
+            status = execute(argv, cwd, deadline, log, ring, env)
+        if deadline and time.time() >= deadline:
+            say("timed out after {0:g}s".format(timeout), log, ring)
+            break
+    result = {
+        "command": command,
+        "status": status,
+        "seconds": round(time.time() - start, 3),
+        "timed_out": bool(deadline) and time.time() >= deadline,
+        "output": list(ring),
+    }
+    for hook in HOOKS:
+        hook(result)
+    return result
+
+
+def cancel():
+    # Stops every command running now, e.g. on shutdown.
+    for process, group in list(RUNNING.items()):
+        stop(process, group)
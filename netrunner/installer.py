@@ -0,0 +1,122 @@
+"""Installing many tools at once.
+
+The tools' steps are first compiled into an install plan (see plan.py),
+then its nodes run on a pool of worker threads as soon as the nodes they
+come after have succeeded. Everything a node prints goes to a log under
+.netrunner/logs/ in the tools directory: <tool>.log for a tool's own
+clones and steps, apt.log and pip.log for the shared ones. Most of an
+install is waiting on git and the network, so with enough workers a whole
+category takes about as long as its slowest tool. Each tool's outcome is
+recorded in the state database (see state.py) as soon as it is known.
+A tool's clones and own steps are checkpointed (see steps.py): installing
+it again after a failure resumes at the step that failed. They run in the
+tool's staging directory, under its lock, and what they made is moved into
+the tools directory once they have all succeeded (see staging.py).
+"""
+import contextlib
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from netrunner import catalog, paths, staging, state, steps, venvs
+
+JOBS = int(os.environ.get("NETRUNNER_JOBS", "4"))
+
+
+def log_path(name):
+    return paths.data_path("logs", name + ".log")
+
+
+def log_name(node):
+    return node["kind"] if node["kind"] in ("apt", "pip") else node["tools"][0]
+
+
+def run_node(node, staged):
+    # staged: {tool: its staging directory}.
+    start = time.time()
+    # A tool's own steps install into its venv, when it has one.
+    venv = venvs.for_tool(catalog.screen(node["tools"][0]), create=True) if node["kind"] == "tool" else None
+    # The shared apt and pip steps are one command each: nothing to resume.
+    checkpoint = node["tools"][0] if node["kind"] in ("clone", "tool") else None
+    with open(log_path(log_name(node)), "a") as log:
+        status = steps.run(node["steps"], check=True, log=log, venv=venv, checkpoint=checkpoint, cwd=staged.get(checkpoint))
+    return {"status": status, "seconds": time.time() - start}
+
+
+def run_plan(plan, workers=JOBS, progress=None):
+    # Returns one result per tool, in the plan's order; progress(result,
+    # done, total) is called as each tool finishes.
+    nodes = {node["id"]: node for node in plan["nodes"]}
+    os.makedirs(os.path.dirname(log_path("apt")), exist_ok=True)
+    for name in set(map(log_name, nodes.values())):
+        open(log_path(name), "w").close()
+    start = time.time()
+    finished = {}
+    results = {}
+    locks = contextlib.ExitStack()
+    staged = {}
+    # In one order, so two Netrunners installing some of the same tools
+    # cannot each hold a lock the other waits on.
+    for tool in sorted(plan["tools"]):
+        locks.enter_context(staging.locked(tool))
+        if plan["sources"][tool][1]:
+            staged[tool] = staging.begin(tool)
+
+    def settle():
+        for tool in plan["tools"]:
+            own = [node for node in nodes.values() if tool in node["tools"]]
+            if tool in results or any(node["id"] not in finished for node in own):
+                continue
+            failed = [node for node in own if finished[node["id"]]["status"]]
+            status = finished[failed[0]["id"]]["status"] if failed else 0
+            if not failed and tool in staged:
+                with open(log_path(tool), "a") as log:
+                    status = staging.finish(tool, log)
+            results[tool] = {
+                "tool": tool,
+                "action": "install",
+                "ok": not status,
+                "status": status,
+                "seconds": round(time.time() - start, 3),
+                "log": log_path(log_name(failed[0]) if failed else tool),
+            }
+            if failed:
+                results[tool]["failed"] = failed[0]["title"]
+            elif status:
+                results[tool]["failed"] = "moving it into place"
+            url, directory = plan["sources"][tool]
+            state.installed(tool, url, directory, results[tool]["status"], results[tool]["seconds"])
+            if progress:
+                progress(results[tool], len(results), len(plan["tools"]))
+
+    settle()
+    waiting = dict(nodes)
+    running = {}
+    with locks, ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while waiting or running:
+            # Ids only point back to earlier nodes, so one pass in id order
+            # also carries a failure down a chain of dependents.
+            for node_id in sorted(waiting):
+                node = waiting[node_id]
+                broken = [finished[after] for after in node["after"] if after in finished and finished[after]["status"]]
+                if broken:
+                    del waiting[node_id]
+                    finished[node_id] = broken[0]
+                elif all(after in finished for after in node["after"]):
+                    del waiting[node_id]
+                    running[pool.submit(run_node, node, staged)] = node_id
+            settle()
+            if running:
+                done, pending = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished[running.pop(future)] = future.result()
+            settle()
+    return [results[tool] for tool in plan["tools"]]
+
+
+def tail(path, lines=10):
+    try:
+        with open(path, errors="replace") as f:
+            return f.read().splitlines()[-lines:]
+    except OSError:
+        return []
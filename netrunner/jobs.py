@@ -0,0 +1,299 @@
+"""Tools started from the menus, running as background jobs.
+
+Running a tool starts a job: a child Netrunner process that runs the
+action's steps in a pseudo-terminal of its own, as the leader of a new
+session. The menu attaches to the job straight away, so the tool looks and
+behaves as it did when it ran in the foreground, and Ctrl-] detaches from
+it and goes back to the menus while the tool keeps running. The jobs screen
+lists the jobs of this session with their CPU time, wall time and exit
+code, and attaches to, tails or kills any of them. Each job gets the
+limits configured for its tool and category (see limits.py).
+
+One asyncio event loop, on a thread of its own, watches every job: it
+copies each job's output to .netrunner/jobs/<id>-<tool>.log, to a ring
+buffer of its last lines and, while attached, to the terminal, and reaps
+the job when it ends, recording how it went and what it used in the state
+database.
+"""
+import collections
+import fcntl
+import json
+import os
+import select
+import struct
+import sys
+import termios
+import threading
+import time
+
+from netrunner import limits, paths, state
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Ctrl-], as in telnet.
+DETACH = b"\x1d"
+# Seconds a killed job gets to exit before it is killed for good.
+GRACE = 5
+TICK = os.sysconf("SC_CLK_TCK")
+CHILD = "import sys; sys.path.insert(0, sys.argv[1]); from netrunner import jobs; sys.exit(jobs.child(*sys.argv[2:]))"
+JOBS = {}
+LOOP = None
+LOOP_LOCK = threading.Lock()
+
+
+def loop():
+    global LOOP
+    with LOOP_LOCK:
+        if LOOP is None:
+            # asyncio alone takes longer to import than the first menu
+            # takes to show, so it waits for the first job.
+            import asyncio
+            LOOP = asyncio.new_event_loop()
+            threading.Thread(target=LOOP.run_forever, name="jobs", daemon=True).start()
+    return LOOP
+
+
+def log_path(job):
+    return paths.data_path("jobs", "{0}-{1}.log".format(job["id"], job["tool"]))
+
+
+def wanted(action_steps):
+    # Whether the steps start anything; the others (opening a page,
+    # updating Netrunner) stay in the foreground.
+    return any(isinstance(step, str) or "run" in step for step in action_steps)
+
+
+def resize(fd):
+    # Gives the job's terminal the size of ours.
+    try:
+        size = os.get_terminal_size(sys.stdout.fileno())
+    except OSError:
+        return
+    fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", size.lines, size.columns, 0, 0))
+
+
+def controlling():
+    # Run in the child: its terminal is the pty, so sudo can ask for a
+    # password and Ctrl-C reaches the tool.
+    fcntl.ioctl(0, termios.TIOCSCTTY, 0)
+
+
+def start(spec, choice, bounds=None):
+    # bounds: the job's limits, as limits.for_tool() finds them.
+    import asyncio
+    import pty
+    import subprocess
+    from netrunner import executor
+    master, slave = pty.openpty()
+    resize(master)
+    job = {
+        "id": len(JOBS) + 1,
+        "tool": spec["id"],
+        "name": spec["name"],
+        "spec": spec,
+        "kind": spec["choices"][choice][0],
+        "started": time.time(),
+        "ended": None,
+        "status": None,
+        "cpu": None,
+        "usage": None,
+        "ring": collections.deque(maxlen=executor.RING),
+        "master": master,
+        "attached": False,
+    }
+    job["log"] = log_path(job)
+    os.makedirs(os.path.dirname(job["log"]), exist_ok=True)
+    job["box"] = box = limits.prepare("{0}-{1}".format(os.getpid(), job["id"]), bounds or {})
+    # No preexec_fn: the jobs thread is running, so the child takes its
+    # terminal and enters its limits itself (see child()).
+    try:
+        process = subprocess.Popen([sys.executable, "-c", CHILD, os.path.dirname(HERE), spec["id"], choice, json.dumps(box)],
+                                   stdin=slave, stdout=slave, stderr=slave, start_new_session=True)
+    except OSError:
+        os.close(master)
+        limits.release(box)
+        raise
+    finally:
+        os.close(slave)
+    job["pid"] = process.pid
+    JOBS[job["id"]] = job
+    asyncio.run_coroutine_threadsafe(watch(job, process), loop())
+    return job
+
+
+async def watch(job, process):
+    import asyncio
+    events = asyncio.get_running_loop()
+    closed = events.create_future()
+    pending = b""
+    log = open(job["log"], "wb")
+
+    def output():
+        nonlocal pending
+        try:
+            data = os.read(job["master"], 65536)
+        except OSError:
+            # EIO: nothing has the job's terminal open any more.
+            data = b""
+        if not data:
+            events.remove_reader(job["master"])
+            if not closed.done():
+                closed.set_result(None)
+            return
+        log.write(data)
+        log.flush()
+        if job["attached"]:
+            os.write(sys.stdout.fileno(), data)
+        lines = (pending + data).split(b"\n")
+        pending = lines.pop()
+        job["ring"].extend(line.decode("utf-8", "replace").rstrip("\r") for line in lines)
+
+    events.add_reader(job["master"], output)
+    pid, status, usage = await events.run_in_executor(None, os.wait4, job["pid"], 0)
+    # The rest of its output; a daemon the tool left behind may keep the
+    # terminal open for good.
+    try:
+        await asyncio.wait_for(closed, 1)
+    except asyncio.TimeoutError:
+        events.remove_reader(job["master"])
+    if pending:
+        job["ring"].append(pending.decode("utf-8", "replace"))
+    log.close()
+    os.close(job["master"])
+    status = os.waitstatus_to_exitcode(status)
+    process.returncode = status
+    used = limits.usage(job["box"], usage)
+    job.update(usage=used, cpu=used["cpu_seconds"], status=128 - status if status < 0 else status, ended=time.time())
+    seconds = job["ended"] - job["started"]
+    if job["kind"] == "install":
+        state.installed(job["tool"], job["spec"]["repo"], job["spec"]["dir"], job["status"], seconds)
+    else:
+        state.ran(job["tool"], job["status"])
+    state.measured(job["tool"], job["kind"], job["started"], seconds, job["status"], used, job["box"]["limits"])
+
+
+def cpu_time(job):
+    # Seconds of CPU the job has used: when it is running, what its
+    # processes have used so far, from /proc.
+    if job["cpu"] is not None:
+        return job["cpu"]
+    stat = limits.read(job["box"]["cgroup"], "cpu.stat") if job["box"]["cgroup"] else None
+    if stat:
+        return int(stat.split()[1]) / 1e6
+    total = 0
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(os.path.join("/proc", entry, "stat")) as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        # Session, then utime, stime, cutime and cstime.
+        if int(fields[3]) == job["pid"]:
+            total += sum(int(field) for field in fields[11:15])
+    return total / TICK
+
+
+def wall_time(job):
+    return (job["ended"] or time.time()) - job["started"]
+
+
+def running():
+    return [job for job in JOBS.values() if job["ended"] is None]
+
+
+def attach(job):
+    # Hands the terminal to the job until it ends (True) or Ctrl-] is
+    # pressed (False).
+    if job["ended"] is not None:
+        return True
+    interactive = sys.stdin.isatty()
+    if interactive:
+        import tty
+        saved = termios.tcgetattr(0)
+        resize(job["master"])
+        tty.setraw(0)
+    job["attached"] = True
+    reading = True
+    try:
+        while job["ended"] is None:
+            if not reading or not select.select([0], [], [], 0.1)[0]:
+                time.sleep(0 if reading else 0.1)
+                continue
+            data = os.read(0, 1024)
+            # Our input ran out, the job's keeps going.
+            reading = bool(data)
+            if DETACH in data:
+                os.write(job["master"], data.split(DETACH)[0])
+                return False
+            os.write(job["master"], data)
+    except OSError:
+        pass
+    finally:
+        job["attached"] = False
+        if interactive:
+            termios.tcsetattr(0, termios.TCSAFLUSH, saved)
+    return True
+
+
+def tail(job, lines=20):
+    return list(job["ring"])[-lines:]
+
+
+def kill(job):
+    import signal
+    if job["ended"] is not None:
+        return
+    try:
+        os.killpg(job["pid"], signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    loop().call_soon_threadsafe(loop().call_later, GRACE, finish, job)
+
+
+def finish(job):
+    import signal
+    if job["ended"] is None:
+        try:
+            os.killpg(job["pid"], signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+def shutdown():
+    # Called when Netrunner exits: its jobs go with it.
+    for job in running():
+        kill(job)
+    deadline = time.time() + GRACE
+    while running() and time.time() < deadline:
+        time.sleep(0.1)
+    for job in running():
+        finish(job)
+
+
+def table():
+    lines = ["    {0:>3}  {1:<22} {2:<9} {3:>8} {4:>9} {5:>9}  {6}".format("ID", "TOOL", "STATE", "CPU", "WALL", "PEAK RSS", "EXIT")]
+    for job in JOBS.values():
+        # A copy, so a job that ends meanwhile is shown as it was.
+        job = dict(job)
+        lines.append("    {0:>3}  {1:<22} {2:<9} {3:>7.1f}s {4:>8.1f}s {5:>9}  {6}".format(
+            job["id"], job["name"][:22], "running" if job["ended"] is None else "done", cpu_time(job), wall_time(job),
+            "{0:.0f}M".format(job["usage"]["peak_rss"] / 1048576.0) if job["usage"] else "",
+            "" if job["status"] is None else job["status"]))
+    if not JOBS:
+        lines.append("    (no jobs yet: tools you run from the menus show up here)")
+    return "\n".join(lines) + "\n"
+
+
+def child(tool, choice, box=None):
+    # The job's own process: takes the pty as its terminal, enters the
+    # job's limits and runs the action's steps there.
+    from netrunner import catalog, staging, steps, venvs
+    controlling()
+    if box:
+        limits.enter(json.loads(box))
+    spec = catalog.screen(tool)
+    kind, action_steps, then = spec["choices"][choice]
+    if kind == "install":
+        return staging.install(spec, action_steps, venv=venvs.for_tool(spec, create=True))
+    return steps.run(action_steps, venv=venvs.for_tool(spec))
@@ -0,0 +1,182 @@
+"""Resource limits and accounting for jobs.
+
+Each job runs in a cgroup v2 group of its own, NETRUNNER_CGROUP (by
+default netrunner/ at the root of the cgroup2 mount) /<pid>-<job>, with
+these limits when they are set:
+
+    cpu_weight   1-10000, 100 is an equal share   cpu.weight
+    memory_max   bytes, or "512M", "4G"           memory.max
+    io_weight    1-10000, 100 is an equal share   io.weight
+
+A limit whose controller the group does not have (no cgroup v2, not root,
+a controller not delegated) falls back to the process: memory_max becomes
+RLIMIT_AS and cpu_weight a nice value. io_weight has no fallback.
+
+Limits come from catalog.json, a "limits" dict on a menu for its whole
+category or on a tool, and from .netrunner/limits.json in the tools
+directory, {"<category or tool>": {...}}, which wins. When the job ends
+its peak RSS, CPU seconds and bytes read and written are taken from the
+group, or from the job's rusage where the group has no figure.
+"""
+import math
+import os
+import resource
+
+from netrunner import paths
+
+KEYS = {"cpu_weight": ("cpu", "cpu.weight"), "memory_max": ("memory", "memory.max"), "io_weight": ("io", "io.weight")}
+UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def config_path():
+    return paths.data_path("limits.json")
+
+
+def for_tool(screens, spec):
+    import json
+    try:
+        with open(config_path()) as f:
+            local = json.load(f)
+    except (OSError, ValueError):
+        local = {}
+    category = spec.get("category")
+    found = {}
+    for limits in (screens.get(category, {}).get("limits"), spec.get("limits"), local.get(category), local.get(spec["id"])):
+        found.update(limits or {})
+    return found
+
+
+def size(value):
+    # Bytes, from 4294967296 or "4G"; "max" is no limit.
+    value = str(value).strip().upper()
+    if value == "MAX":
+        return None
+    if value[-1:] in UNITS:
+        return int(float(value[:-1]) * UNITS[value[-1]])
+    return int(value)
+
+
+def cgroup_root():
+    root = os.environ.get("NETRUNNER_CGROUP")
+    if root:
+        return root
+    try:
+        with open("/proc/self/mounts") as f:
+            for line in f:
+                fields = line.split()
+                if fields[2] == "cgroup2":
+                    return os.path.join(fields[1], "netrunner")
+    except OSError:
+        pass
+    return None
+
+
+def write(directory, name, value):
+    with open(os.path.join(directory, name), "w") as f:
+        f.write(value)
+
+
+def read(directory, name):
+    try:
+        with open(os.path.join(directory, name)) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def controllers(directory):
+    return set((read(directory, "cgroup.controllers") or "").split())
+
+
+def prepare(name, limits):
+    # Where and how a job is limited: {"cgroup": directory or None,
+    # "limits": the limits, "rlimits": those left to the process}.
+    box = {"cgroup": None, "limits": limits, "rlimits": dict(limits)}
+    root = cgroup_root()
+    if not root:
+        return box
+    try:
+        os.makedirs(root, exist_ok=True)
+        # Controllers have to be enabled on the way down to the group.
+        for parent in (os.path.dirname(root), root):
+            for controller in controllers(parent) & {"cpu", "memory", "io"}:
+                if controller not in (read(parent, "cgroup.subtree_control") or "").split():
+                    write(parent, "cgroup.subtree_control", "+" + controller)
+        directory = os.path.join(root, name)
+        os.mkdir(directory)
+    except OSError:
+        return box
+    box["cgroup"] = directory
+    have = controllers(directory)
+    for key, value in limits.items():
+        controller, setting = KEYS.get(key, (None, None))
+        if controller not in have:
+            continue
+        if key == "memory_max":
+            value = size(value) or "max"
+        elif key == "io_weight":
+            value = "default {0}".format(value)
+        try:
+            write(directory, setting, str(value))
+            del box["rlimits"][key]
+        except OSError:
+            pass
+    return box
+
+
+def enter(box):
+    # Runs in the job's process before it starts the tool.
+    if box["cgroup"]:
+        try:
+            write(box["cgroup"], "cgroup.procs", "0")
+        except OSError:
+            box["cgroup"] = None
+    rlimits = box["rlimits"] if box["cgroup"] else box["limits"]
+    if rlimits.get("memory_max") and size(rlimits["memory_max"]):
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (size(rlimits["memory_max"]),) * 2)
+        except (OSError, ValueError):
+            pass
+    if rlimits.get("cpu_weight"):
+        # Each nice level is about 1.25 times the share of the next one.
+        nice = round(math.log(100 / float(rlimits["cpu_weight"]), 1.25))
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, max(-20, min(19, nice)))
+        except OSError:
+            pass
+
+
+def usage(box, rusage):
+    # {"peak_rss", "cpu_seconds", "read_bytes", "written_bytes"} of a job
+    # that has ended; its group is removed.
+    found = {
+        "peak_rss": rusage.ru_maxrss * 1024,
+        "cpu_seconds": rusage.ru_utime + rusage.ru_stime,
+        "read_bytes": rusage.ru_inblock * 512,
+        "written_bytes": rusage.ru_oublock * 512,
+    }
+    directory = box["cgroup"]
+    if not directory:
+        return found
+    stat = dict(line.split() for line in (read(directory, "cpu.stat") or "").splitlines() if len(line.split()) == 2)
+    # A group that used no CPU at all is one the job never got into.
+    if int(stat.get("usage_usec", 0)):
+        found["cpu_seconds"] = int(stat["usage_usec"]) / 1e6
+        peak = read(directory, "memory.peak")
+        if peak and peak.strip().isdigit():
+            found["peak_rss"] = int(peak)
+        io = [dict(field.split("=") for field in line.split()[1:]) for line in (read(directory, "io.stat") or "").splitlines()]
+        if io:
+            found["read_bytes"] = sum(int(device.get("rbytes", 0)) for device in io)
+            found["written_bytes"] = sum(int(device.get("wbytes", 0)) for device in io)
+    release(box)
+    return found
+
+
+def release(box):
+    if box["cgroup"]:
+        try:
+            os.rmdir(box["cgroup"])
+        except OSError:
+            # Something the tool left behind is still in there.
+            pass
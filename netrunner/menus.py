@@ -0,0 +1,214 @@
+"""Netrunner's menus: the screens of catalog.json, drawn and navigated.
+
+Netrunner.py hands the terminal to run() once it knows the tools
+directory. Only the menus are unmarshalled at startup; a tool's screen, and
+the rest of its category with it, when it is first opened (see catalog.py).
+
+A path such as 1.11 or info/striker, given as `Netrunner 1.11` or typed at
+any menu prompt, opens that screen straight away, with the menus above it
+waiting on the stack for Back but never drawn on the way.
+"""
+import os
+import time
+
+from netrunner import catalog, jobs, limits, render, state
+
+Logo="""\033[33m
+
+  
+░█████╗░██╗░░░██╗██████╗░███████╗██████╗░██████╗░██╗░░░██╗███╗░░██╗██╗░░██╗  ██████╗░░█████╗░███████╗███████╗
+██╔══██╗╚██╗░██╔╝██╔══██╗██╔════╝██╔══██╗██╔══██╗██║░░░██║████╗░██║██║░██╔╝  ╚════██╗██╔══██╗╚════██║╚════██║
+██║░░╚═╝░╚████╔╝░██████╦╝█████╗░░██████╔╝██████╔╝██║░░░██║██╔██╗██║█████═╝░  ░░███╔═╝██║░░██║░░░░██╔╝░░░░██╔╝
+██║░░██╗░░╚██╔╝░░██╔══██╗██╔══╝░░██╔══██╗██╔═══╝░██║░░░██║██║╚████║██╔═██╗░  ██╔══╝░░██║░░██║░░░██╔╝░░░░██╔╝░
+╚█████╔╝░░░██║░░░██████╦╝███████╗██║░░██║██║░░░░░╚██████╔╝██║░╚███║██║░╚██╗  ███████╗╚█████╔╝░░██╔╝░░░░██╔╝░░
+░╚════╝░░░░╚═╝░░░╚═════╝░╚══════╝╚═╝░░╚═╝╚═╝░░░░░░╚═════╝░╚═╝░░╚══╝╚═╝░░╚═╝  ╚══════╝░╚════╝░░░╚═╝░░░░░╚═╝░░░
+
+                ███╗░░██╗███████╗████████╗██████╗░██╗░░░██╗███╗░░██╗███╗░░██╗███████╗██████╗░
+                ████╗░██║██╔════╝╚══██╔══╝██╔══██╗██║░░░██║████╗░██║████╗░██║██╔════╝██╔══██╗
+                ██╔██╗██║█████╗░░░░░██║░░░██████╔╝██║░░░██║██╔██╗██║██╔██╗██║█████╗░░██████╔╝
+                ██║╚████║██╔══╝░░░░░██║░░░██╔══██╗██║░░░██║██║╚████║██║╚████║██╔══╝░░██╔══██╗ 
+                ██║░╚███║███████╗░░░██║░░░██║░░██║╚██████╔╝██║░╚███║██║░╚███║███████╗██║░░██║
+                ╚═╝░░╚══╝╚══════╝░░░╚═╝░░░╚═╝░░╚═╝░╚═════╝░╚═╝░░╚══╝╚═╝░░╚══╝╚══════╝╚═╝░░╚═╝   
+ 
+
+                                    \033[97m[!] https://github.com/MiChaelinzo/CyberPunkNetrunner \n
+                                    \033[91m[X] Please Don't Use For illegal Activity [X]
+\033[97m """
+
+PROMPT = "几乇ㄒ尺ㄩ几几乇尺  =>> "
+
+# Every screen returns what to show next instead of calling it: the name of
+# another screen is pushed on the stack, BACK pops the current screen, HOME
+# unwinds to the main menu and EXIT leaves Netrunner. A list of screens, as
+# catalog.link() gives, replaces the stack. Returning nothing shows the
+# current screen again.
+BACK = object()
+HOME = object()
+EXIT = object()
+THEN = {"back": BACK, "stay": None, "exit": EXIT}
+
+def run(screen, link=None):
+    # link: a path to open instead of the screen.
+    # Only a new state database needs every tool's screen, to adopt what
+    # is already installed.
+    state.adopt(catalog.load() if not os.path.exists(state.db_path()) else {})
+    stack = catalog.link(link) if link else [screen]
+    while stack:
+        action = show(stack[-1])
+        if action is None:
+            continue
+        if action is BACK:
+            stack.pop()
+        elif action is HOME:
+            del stack[1:]
+        elif action is EXIT:
+            break
+        elif isinstance(action, list):
+            stack = list(action)
+        else:
+            stack.append(action)
+    jobs.shutdown()
+
+def show(name):
+    spec = catalog.screen(name)
+    return SCREEN_TYPES[spec["type"]](spec)
+
+def menu_screen(spec):
+    screen = [render.CLEAR]
+    if spec["logo"]:
+        screen.append(Logo + "\n")
+    if spec["title"]:
+        screen.append(render.banner(spec["title"]))
+    screen.append(listing(spec) + "\n")
+    screen.append("    [/] Search every tool\n\n")
+    render.paint(*screen)
+    choice = input(PROMPT).strip()
+    if choice.startswith("/"):
+        return palette(choice[1:])
+    if choice == "99":
+        if not spec["root"]:
+            return BACK
+        print("Happy Hacking...")
+        time.sleep(1)
+        clearScr()
+        return EXIT
+    target = spec["choices"].get(catalog.choice_key(choice))
+    if not target and ("." in choice or "/" in choice):
+        # A path from the main menu, as 1.11 or info/striker; a number
+        # this menu does not have is a typo, not a path.
+        target = catalog.link(choice)
+    if target:
+        clearScr()
+        return target
+    if choice:
+        print("\n ERROR: Wrong Input")
+        time.sleep(2)
+
+def palette(query):
+    # The / search: a result's number opens that tool, anything else is
+    # searched for in turn.
+    from netrunner import search
+    while True:
+        if not query.strip():
+            query = input("Search >> ")
+            if not query.strip():
+                return None
+        found = search.find(query)
+        lines = ["    [{0}] {1:<45} {2}".format(i, name, category) for i, (tool, name, category) in enumerate(found, 1)]
+        if not lines:
+            lines.append("    Nothing matches {0!r}".format(query.strip()))
+        lines.append("    [99] Back")
+        render.paint(render.CLEAR, render.banner("Search"), "\n".join(lines) + "\n\n")
+        choice = input("Number, or another search >> ").strip()
+        if choice in ("", "99"):
+            return None
+        if choice.isdigit() and 0 < int(choice) <= len(found):
+            clearScr()
+            return found[int(choice) - 1][0]
+        query = choice.lstrip("/")
+
+def listing(spec):
+    # The menu's lines with a ✔ and the commit, or ✘, after the tools the
+    # state database knows about.
+    rows = state.tools(target for key, target in spec["items"])
+    if not rows and not jobs.running():
+        return spec["listing"]
+    lines = spec["listing"].split("\n")
+    for i, (key, target) in enumerate(spec["items"]):
+        if state.badge(rows.get(target)):
+            lines[i] += "  " + state.badge(rows[target])
+        elif target == "jobs" and jobs.running():
+            lines[i] += "  {0} running".format(len(jobs.running()))
+    return "\n".join(lines)
+
+def tool_screen(spec):
+    screen = []
+    if spec.get("logo"):
+        screen.append(Logo + "\n")
+    if "description" in spec:
+        screen.append(render.box(spec["description"], spec.get("style", "boy")))
+    if "text" in spec:
+        screen.append(spec["text"] + "\n")
+    render.paint(*screen)
+    choice = input(spec["prompt"]).strip()
+    if choice == "99":
+        return BACK
+    action = spec["choices"].get(choice)
+    if action is None:
+        return HOME
+    kind, action_steps, then = action
+    if kind != "install" and state.not_installed(spec, action_steps):
+        print("\n {0} is not installed yet: choose Install first".format(spec["name"]))
+        time.sleep(2)
+        return None
+    if jobs.wanted(action_steps):
+        # The job records how the tool ran when it ends.
+        job = jobs.start(spec, choice, limits.for_tool(catalog.menus(), spec))
+        print("\n [{0}] {1} started: Ctrl-] puts it in the background\n".format(job["id"], spec["name"]))
+        if not jobs.attach(job):
+            print("\n\n [{0}] {1} keeps running: see Jobs in the main menu".format(job["id"], spec["name"]))
+            time.sleep(2)
+        return THEN[then]
+    from netrunner import staging, steps, venvs
+    start = time.time()
+    if kind == "install":
+        status = staging.install(spec, action_steps, venv=venvs.for_tool(spec, create=True))
+        state.installed(spec["id"], spec["repo"], spec["dir"], status, time.time() - start)
+    else:
+        status = steps.run(action_steps, venv=venvs.for_tool(spec))
+        state.ran(spec["id"], status)
+    return THEN[then]
+
+def jobs_screen(spec):
+    render.paint(render.CLEAR, render.banner(spec["name"]), jobs.table() + "\n")
+    choice = input("[a N]Attach [t N]Tail [k N]Kill [Enter]Refresh [99]Back >> ").strip().lower().split()
+    if choice == ["99"]:
+        return BACK
+    if len(choice) != 2 or choice[0] not in ("a", "t", "k") or not choice[1].isdigit() or int(choice[1]) not in jobs.JOBS:
+        if choice:
+            print("\n ERROR: Wrong Input")
+            time.sleep(2)
+        return None
+    job = jobs.JOBS[int(choice[1])]
+    if choice[0] == "a":
+        clearScr()
+        print("\n".join(jobs.tail(job)))
+        if jobs.attach(job):
+            input("\n [{0}] {1} exited with {2}; press Enter ".format(job["id"], job["name"], job["status"]))
+    elif choice[0] == "t":
+        print("\n" + "\n".join(jobs.tail(job)) + "\n")
+        input(" {0}; press Enter ".format(job["log"]))
+    else:
+        jobs.kill(job)
+
+SCREEN_TYPES = {"menu": menu_screen, "tool": tool_screen, "jobs": jobs_screen}
+
+def system():
+    # platform.system(), without importing platform at startup.
+    return "Windows" if os.name == "nt" else os.uname().sysname
+
+def clearScr():
+    if system() == 'Linux':
+        render.paint(render.CLEAR)
+    if system() == 'Windows':
+        os.system('cls')
@@ -0,0 +1,274 @@
+"""A local cache of the git repositories Netrunner clones.
+
+Every repository a tool installs from is kept once as a bare mirror under
+.netrunner/mirrors/ (or NETRUNNER_MIRROR_DIR), named by a hash of its URL.
+A clone fetches into the mirror only when the mirror is older than
+NETRUNNER_MIRROR_TTL seconds, then clones from the mirror on the local
+disk, where git hardlinks the objects instead of copying them. Reinstalling
+a tool, or installing it for a second tools directory, costs no network at
+all, and a warm mirror keeps working offline: when the fetch fails the
+mirror is used as it is. A clone into a directory that already holds a
+clone of the same repository, left by an install that stopped part way,
+finishes that one instead of failing.
+
+The checkout does not borrow objects from the mirror (as --reference
+would), so mirrors can be evicted at any time: once the cache grows past
+NETRUNNER_MIRROR_MAX_MB the least recently used ones are removed.
+
+Tools need the files of their default branch, not its history, so how much
+of a repository is fetched is a clone strategy:
+
+* "full": every commit and file, as `git clone` does,
+* "shallow": the latest commit only (`--depth 1`),
+* "partial": every commit but only the files the checkout needs
+  (`--filter=blob:none`); the rest is fetched if git ever asks for it.
+
+A clone step can also name "sparse" paths, to check out only those
+directories (on a partial mirror unless it says otherwise). Steps pick a
+strategy with "strategy"; the others use NETRUNNER_CLONE_STRATEGY, shallow
+by default. The catalog gives tools whose steps read the git history a full
+clone (see catalog.py). A full mirror, when there is one, serves every
+strategy.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+
+from netrunner import paths
+
+TTL = float(os.environ.get("NETRUNNER_MIRROR_TTL", "3600"))
+MAX_MB = float(os.environ.get("NETRUNNER_MIRROR_MAX_MB", "4096"))
+STRATEGY = os.environ.get("NETRUNNER_CLONE_STRATEGY", "shallow")
+# What `git clone --bare` and `git fetch` get for each kind of mirror.
+OPTIONS = {"full": [], "shallow": ["--depth", "1"], "partial": ["--filter=blob:none"]}
+# The refs a mirror keeps: branches and tags, not the pull requests and
+# the other refs GitHub serves, which `clone --mirror` would fetch too.
+REFSPECS = ["+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"]
+KEPT = ("refs/heads/", "refs/tags/")
+# Makes a checkout of a partial mirror fetch missing files from origin.
+PROMISOR = [("core.repositoryformatversion", "1"), ("extensions.partialClone", "origin"),
+            ("remote.origin.promisor", "true"), ("remote.origin.partialCloneFilter", "blob:none")]
+
+
+def mirror_dir():
+    return os.environ.get("NETRUNNER_MIRROR_DIR") or paths.data_path("mirrors")
+
+
+def checkout_name(url):
+    # The directory `git clone URL` picks when it is not given one.
+    name = os.path.basename(url.rstrip("/"))
+    return name[:-4] if name.endswith(".git") else name
+
+
+def key(url, kind="full"):
+    # https://github.com/a/b, https://github.com/a/b.git and .../b/ are
+    # the same repository.
+    url = url.strip().rstrip("/")
+    if url.endswith(".git"):
+        url = url[:-4]
+    name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return name if kind == "full" else name + "-" + kind
+
+
+def locked(name, wait=True):
+    return paths.locked(os.path.join(mirror_dir(), name + ".lock"), wait)
+
+
+def git(args, log=None):
+    if log is not None:
+        log.write("$ git " + " ".join(args) + "\n")
+        log.flush()
+    return subprocess.call(["git"] + args, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT if log else None)
+
+
+def lines(repo, args):
+    found = subprocess.run(["git", "-C", repo] + args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    return found.stdout.splitlines()
+
+
+def read_info(name):
+    try:
+        with open(os.path.join(mirror_dir(), name + ".json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def configure(repo, kind):
+    # What the mirror's fetches bring in: the one branch of a shallow
+    # mirror, every branch and tag of the others.
+    if kind == "shallow":
+        branch = (lines(repo, ["symbolic-ref", "HEAD"]) or ["refs/heads/master"])[0]
+        specs = ["+{0}:{0}".format(branch)]
+    else:
+        specs = REFSPECS
+    lines(repo, ["config", "--unset-all", "remote.origin.fetch"])
+    for spec in specs:
+        lines(repo, ["config", "--add", "remote.origin.fetch", spec])
+
+
+def unmirror(repo, kind):
+    # Mirrors made with `clone --mirror` stop fetching every ref, and drop
+    # the ones they fetched besides branches and tags.
+    if lines(repo, ["config", "--get", "remote.origin.mirror"]) != ["true"]:
+        return
+    lines(repo, ["config", "--unset", "remote.origin.mirror"])
+    configure(repo, kind)
+    stray = [ref for ref in lines(repo, ["for-each-ref", "--format=%(refname)"]) if not ref.startswith(KEPT)]
+    subprocess.run(["git", "-C", repo, "update-ref", "--stdin"], input="".join("delete {0}\n".format(ref) for ref in stray),
+                   text=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def refresh(url, kind="full", log=None):
+    # Path of an up to date (or, offline, the last) mirror of url, or None
+    # when there is none and it cannot be fetched. Call with the lock held.
+    name = key(url, kind)
+    repo = os.path.join(mirror_dir(), name + ".git")
+    info = read_info(name)
+    now = time.time()
+    if os.path.isdir(repo):
+        unmirror(repo, kind)
+        if now - info.get("fetched", 0) > TTL and git(["-C", repo, "fetch", "--prune", "--quiet"] + OPTIONS[kind][:2], log) == 0:
+            info.update(fetched=now, bytes=size(repo))
+    else:
+        tmp = "{0}.{1}".format(repo, os.getpid())
+        shutil.rmtree(tmp, ignore_errors=True)
+        if git(["clone", "--bare", "--quiet"] + OPTIONS[kind] + [url, tmp], log):
+            shutil.rmtree(tmp, ignore_errors=True)
+            return None
+        configure(tmp, kind)
+        os.replace(tmp, repo)
+        # What the first fetch cost, for comparing strategies.
+        info = {"url": url, "strategy": kind, "fetched": now, "seconds": round(time.time() - now, 3), "bytes": size(repo)}
+    info["used"] = now
+    paths.write_file(os.path.join(mirror_dir(), name + ".json"), json.dumps(info).encode("utf-8"))
+    return repo
+
+
+def stale(url):
+    # Makes the next clone of url fetch into its mirrors whatever their
+    # age, as when the updater has seen the remote move on.
+    for kind in OPTIONS:
+        name = key(url, kind)
+        with locked(name):
+            info = read_info(name)
+            if info.get("fetched"):
+                info["fetched"] = 0
+                paths.write_file(os.path.join(mirror_dir(), name + ".json"), json.dumps(info).encode("utf-8"))
+
+
+def in_cone(path, sparse):
+    # Whether a sparse checkout of these directories has the file: cone
+    # mode also keeps the files next to each directory on the way there.
+    parent = os.path.dirname(path)
+    return not parent or any(path.startswith(top.rstrip("/") + "/") or top.startswith(parent + "/") for top in sparse)
+
+
+def fill(repo, sparse=None, log=None):
+    # Fetches into a partial mirror the files its HEAD checks out.
+    missing = {line[1:] for line in lines(repo, ["rev-list", "--objects", "--no-walk", "--missing=print", "HEAD"]) if line.startswith("?")}
+    if sparse:
+        listed = [line.split("\t", 1) for line in lines(repo, ["ls-tree", "-r", "HEAD"])]
+        missing &= {entry.split()[2] for entry, path in listed if in_cone(path, sparse)}
+    if not missing:
+        return 0
+    if log is not None:
+        log.write("$ git -C {0} fetch origin ({1} files)\n".format(repo, len(missing)))
+        log.flush()
+    fetch = ["git", "-C", repo, "fetch", "--quiet", "--no-tags", "--no-write-fetch-head", "--filter=blob:none", "--stdin", "origin"]
+    return subprocess.run(fetch, input="\n".join(missing) + "\n", text=True, stdout=log, stderr=subprocess.STDOUT if log else None).returncode
+
+
+def leftover(url, directory):
+    # "done" when directory is already a clone of url, "partial" when it is
+    # one this module began and was cut short before it pointed it at url,
+    # None otherwise.
+    if not os.path.isdir(os.path.join(directory, ".git")):
+        return None
+    origin = (lines(directory, ["config", "--get", "remote.origin.url"]) or [""])[0]
+    if origin and key(origin) == key(url):
+        return "done"
+    if origin and os.path.realpath(os.path.dirname(origin)) == os.path.realpath(mirror_dir()) and os.path.basename(origin).startswith(key(url)):
+        return "partial"
+    return None
+
+
+def strategy_of(strategy=None, sparse=None):
+    # The strategy a clone step uses: its own, or the default.
+    return strategy or ("partial" if sparse else STRATEGY)
+
+
+def clone(url, directory=None, strategy=None, sparse=None, log=None):
+    # `git clone url directory` through the mirror; returns git's status.
+    directory = directory or checkout_name(url)
+    found = leftover(url, directory)
+    if found == "done":
+        # An earlier install got this far: check out whatever it had not
+        # yet, instead of failing on the directory being there.
+        return git(["-C", directory, "checkout", "--quiet"], log)
+    if found == "partial":
+        shutil.rmtree(directory, ignore_errors=True)
+    strategy = strategy_of(strategy, sparse)
+    kind = "full" if os.path.isdir(os.path.join(mirror_dir(), key(url) + ".git")) else strategy
+    with locked(key(url, kind)):
+        repo = refresh(url, kind, log)
+        if repo is None:
+            # No mirror and no network to make one: let git say why.
+            return git(["clone", url, directory], log)
+        status = fill(repo, sparse, log) if kind == "partial" else 0
+        commands = [["clone", "--quiet", "--no-checkout", repo, directory], ["-C", directory, "remote", "set-url", "origin", url]]
+        if kind == "partial":
+            commands += [["-C", directory, "config", name, value] for name, value in PROMISOR]
+        if sparse:
+            commands.append(["-C", directory, "sparse-checkout", "set"] + list(sparse))
+        commands.append(["-C", directory, "checkout", "--quiet"])
+        for command in commands:
+            status = status or git(command, log)
+    evict()
+    return status
+
+
+def size(path):
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            with contextlib.suppress(OSError):
+                total += os.lstat(os.path.join(root, name)).st_size
+    return total
+
+
+def mirrors():
+    # [(name, info, bytes)] of every mirror, least recently used first. The
+    # size is the one recorded at its last fetch; only mirrors without a
+    # record are measured.
+    try:
+        names = [entry[:-4] for entry in os.listdir(mirror_dir()) if entry.endswith(".git")]
+    except OSError:
+        return []
+    found = []
+    for name in names:
+        info = read_info(name)
+        used = info.get("bytes")
+        found.append((name, info, used if used is not None else size(os.path.join(mirror_dir(), name + ".git"))))
+    return sorted(found, key=lambda mirror: mirror[1].get("used", 0))
+
+
+def evict(limit_mb=MAX_MB):
+    # Removes the least recently used mirrors until the rest fit in
+    # limit_mb; mirrors that are in use right now are left alone.
+    found = mirrors()
+    total = sum(mirror[2] for mirror in found)
+    for name, info, used in found:
+        if total <= limit_mb * 1024 * 1024:
+            break
+        with locked(name, wait=False) as got:
+            if got:
+                shutil.rmtree(os.path.join(mirror_dir(), name + ".git"), ignore_errors=True)
+                # The lock file stays: another clone may be waiting on it.
+                with contextlib.suppress(OSError):
+                    os.remove(os.path.join(mirror_dir(), name + ".json"))
+                total -= used
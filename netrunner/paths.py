@@ -0,0 +1,61 @@
+"""Where Netrunner keeps the tools it installs and its own files.
+
+Tools are cloned into the directory chosen on first start and recorded in
+/home/Netrunnerpath.txt. Netrunner's caches and records live next to
+them in a hidden .netrunner directory. NETRUNNER_HOME overrides the
+recorded directory; before a directory is chosen the default one is used.
+The mirror cache and installs take turns through the file locks of
+locked().
+"""
+import contextlib
+import fcntl
+import os
+import threading
+
+PATH_FILE = "/home/Netrunnerpath.txt"
+# What the first-start "[2]Default" choice records.
+DEFAULT = "/home/Netrunner/"
+
+
+def tools_dir():
+    home = os.environ.get("NETRUNNER_HOME")
+    if home:
+        return home
+    try:
+        with open(PATH_FILE) as f:
+            return f.readline().strip() or DEFAULT
+    except OSError:
+        return DEFAULT
+
+
+def data_path(*names):
+    return os.path.join(tools_dir(), ".netrunner", *names)
+
+
+def write_file(target, data):
+    # Readers see the old file or the new one, never half of it.
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = "{0}.{1}.{2}".format(target, os.getpid(), threading.get_ident())
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, target)
+
+
+@contextlib.contextmanager
+def locked(target, wait=True, busy=None):
+    # An exclusive flock() on the file target. flock() locks belong to the
+    # open file, so this keeps out other Netrunner processes and other
+    # threads alike. Yields False when wait is false and the lock is taken;
+    # busy() is called before waiting for one that is.
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, "w") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            if not wait:
+                yield False
+                return
+            if busy:
+                busy()
+            fcntl.flock(f, fcntl.LOCK_EX)
+        yield True
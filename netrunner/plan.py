@@ -0,0 +1,229 @@
+"""Turning the install steps of many tools into one install plan.
+
+Installed one by one, tools repeat the same system work: each runs its own
+apt-get and pip, and the clones wait on each other. build() reads the
+shell steps of the selected tools and pulls out
+
+* every `apt install` (and `apt update`, `add-apt-repository`) into one
+  apt-get transaction,
+* every plain `pip install` into one pip run, after the clones whose
+  requirements files it reads (in the tools' staging directories, see
+  staging.py), except for tools that get a venv of their own (see
+  venvs.py), which keep theirs,
+* every clone into a step of its own, so clones run in parallel,
+
+and leaves the rest of each tool's steps, in their original order, for
+after the shared steps that tool needed. The result is a small DAG: a list
+of nodes, each with the ids of the nodes it runs after.
+"""
+import os
+import shlex
+
+from netrunner import mirror, staging, venvs
+
+SUDO = "" if not hasattr(os, "geteuid") or os.geteuid() == 0 else "sudo "
+# pip options that change nothing about what gets installed.
+PIP_HARMLESS = {"--no-cache-dir", "-q", "--quiet"}
+# Steps that are kept whole rather than split into their commands.
+WHOLE = ("||", "`", "$(")
+
+
+def split_commands(step):
+    # The commands of a shell step, split on `;` and `&&` outside quotes.
+    parts = []
+    current = []
+    quote = None
+    i = 0
+    while i < len(step):
+        char = step[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == ";" or step.startswith("&&", i):
+            parts.append("".join(current))
+            current = []
+            i += 1 if char == ";" else 2
+            continue
+        current.append(char)
+        i += 1
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def pip_install(args):
+    # (packages, requirement files) of `pip install ARGS`, or None when it
+    # uses options that should not be applied to everyone's packages.
+    packages = []
+    files = []
+    i = 0
+    while i < len(args):
+        if args[i] in ("-r", "--requirement") and i + 1 < len(args):
+            files.append(args[i + 1])
+            i += 2
+            continue
+        if args[i].startswith("-"):
+            if args[i] not in PIP_HARMLESS:
+                return None
+        else:
+            packages.append(args[i])
+        i += 1
+    return packages, files
+
+
+def classify(command):
+    try:
+        words = shlex.split(command)
+    except ValueError:
+        return "shell", None
+    if words[:1] == ["sudo"]:
+        words = words[1:]
+    if not words:
+        return "shell", None
+    if words[0] == "cd" and len(words) == 2:
+        return "cd", words[1]
+    if words[0] == "add-apt-repository" and len(words) == 2:
+        return "apt-repository", words[1]
+    if words[0] in ("apt", "apt-get"):
+        args = [word for word in words[1:] if word not in ("-y", "--yes", "-q")]
+        if args == ["update"]:
+            return "apt-update", None
+        if args[:1] == ["install"] and len(args) > 1 and not any(arg.startswith("-") for arg in args):
+            return "apt", args[1:]
+    if words[0] in ("pip", "pip2", "pip3"):
+        args = words[1:]
+    elif words[0] in ("python", "python3") and words[1:3] == ["-m", "pip"]:
+        args = words[3:]
+    else:
+        args = None
+    if args and args[0] == "install":
+        found = pip_install(args[1:])
+        if found:
+            return "pip", found
+    if words[:2] == ["git", "clone"]:
+        return "clone", None
+    return "shell", None
+
+
+def placed(step):
+    # The commands of a shell step as the plan runs them, each after the
+    # cd it needs: "cd nmap && make" of "cd nmap && ./configure && make".
+    if any(token in step for token in WHOLE):
+        return [step]
+    cwd = ""
+    found = []
+    for command in split_commands(step):
+        kind, target = classify(command)
+        if kind == "cd":
+            cwd = os.path.normpath(os.path.join(cwd, target))
+        else:
+            found.append("cd {0} && {1}".format(cwd, command) if cwd else command)
+    return found or [step]
+
+
+def unique(items):
+    return list(dict.fromkeys(items))
+
+
+def build(jobs):
+    # jobs: [(spec, install_steps)], as the command line collects them.
+    repositories, packages, requirements, files = [], [], [], []
+    update = False
+    users = {"apt": set(), "pip": set()}
+    pip_needs = set()
+    clones = {}
+    rest = {}
+    for spec, install_steps in jobs:
+        tool = spec["id"]
+        clones[tool] = []
+        rest[tool] = []
+        own_venv = venvs.ENABLED and venvs.wanted(spec)
+        # Where the tool's steps run until it is moved into place.
+        base = staging.staging_dir(tool) if spec["dir"] else ""
+        for step in install_steps:
+            if isinstance(step, dict) and "clone" in step:
+                clones[tool].append(step)
+                continue
+            if not isinstance(step, str) or any(token in step for token in WHOLE):
+                rest[tool].append(step)
+                continue
+            cwd = ""
+            for command in split_commands(step):
+                kind, found = classify(command)
+                if kind == "cd":
+                    cwd = os.path.normpath(os.path.join(cwd, found))
+                elif kind == "apt-repository":
+                    repositories.append(found)
+                    users["apt"].add(tool)
+                elif kind == "apt-update":
+                    update = True
+                    users["apt"].add(tool)
+                elif kind == "apt":
+                    packages.extend(found)
+                    users["apt"].add(tool)
+                elif kind == "pip" and not own_venv:
+                    requirements.extend(found[0])
+                    files.extend(os.path.normpath(os.path.join(base, cwd, name)) for name in found[1])
+                    users["pip"].add(tool)
+                    if found[1]:
+                        pip_needs.add(tool)
+                elif kind == "clone" and not cwd:
+                    clones[tool].append(command)
+                else:
+                    rest[tool].append("cd {0} && {1}".format(cwd, command) if cwd else command)
+    nodes = []
+
+    def add(kind, title, node_steps, after, tools):
+        nodes.append({"id": len(nodes) + 1, "kind": kind, "title": title, "steps": node_steps, "after": after, "tools": tools})
+        return len(nodes)
+
+    apt = None
+    if users["apt"]:
+        apt_steps = [SUDO + "add-apt-repository -y " + shlex.quote(name) for name in unique(repositories)]
+        if update or repositories:
+            apt_steps.append(SUDO + "apt-get update")
+        if packages:
+            apt_steps.append(SUDO + "apt-get install -y " + " ".join(map(shlex.quote, unique(packages))))
+        apt = add("apt", "apt", apt_steps, [], sorted(users["apt"]))
+    cloned = {}
+    for spec, install_steps in jobs:
+        tool = spec["id"]
+        cloned[tool] = [add("clone", "clone " + tool, [command], [], [tool]) for command in clones[tool]]
+    pip = None
+    if users["pip"]:
+        command = SUDO + "python3 -m pip install"
+        command += "".join(" " + shlex.quote(name) for name in unique(requirements))
+        command += "".join(" -r " + shlex.quote(name) for name in unique(files))
+        after = [apt] if apt else []
+        after += [node for tool in pip_needs for node in cloned[tool]]
+        pip = add("pip", "pip", [command], sorted(after), sorted(users["pip"]))
+    for spec, install_steps in jobs:
+        tool = spec["id"]
+        if not rest[tool]:
+            continue
+        after = list(cloned[tool])
+        if tool in users["apt"]:
+            after.append(apt)
+        if tool in users["pip"]:
+            after.append(pip)
+        add("tool", tool, rest[tool], sorted(after), [tool])
+    return {
+        "tools": [spec["id"] for spec, install_steps in jobs],
+        "sources": {spec["id"]: [spec["repo"], spec["dir"]] for spec, install_steps in jobs},
+        "nodes": nodes,
+    }
+
+
+def describe(plan):
+    kinds = [node["kind"] for node in plan["nodes"]]
+    lines = ["Install plan for {0} tools: {1} apt transaction, {2} pip run, {3} clones, {4} tool step lists".format(
+        len(plan["tools"]), kinds.count("apt"), kinds.count("pip"), kinds.count("clone"), kinds.count("tool"))]
+    for node in plan["nodes"]:
+        after = "  (after {0})".format(", ".join(map(str, node["after"]))) if node["after"] else ""
+        lines.append("[{0}] {1}{2}".format(node["id"], node["title"], after))
+        for step in node["steps"]:
+            if isinstance(step, dict) and "clone" in step:
+                step = "clone " + " ".join([step["clone"], step.get("dir", ""), "(" + mirror.strategy_of(step.get("strategy"), step.get("sparse")) + ")"]).replace("  ", " ")
+            lines.append("      " + (step if isinstance(step, str) else repr(step)))
+    return "\n".join(lines)
@@ -0,0 +1,352 @@
+"""Banners, boxes and rainbow colours for Netrunner screens, drawn in process.
+
+Screens used to pipe every banner through `figlet | lolcat` and every tool
+description through `boxes | lolcat`, forking a shell and two or three
+interpreters per paint. This module draws the same things in Python:
+figlet's "standard" font (fonts/standard.flf), the boxes designs the
+catalog uses (boy, parchment, headline and the default C comment box) and
+lolcat's sine rainbow. A screen is built as one string and written to the
+terminal in a single write.
+
+Drawn banners and boxes are kept, as the final ANSI bytes, in
+.netrunner/render.cache under the tools directory, so a repeat visit to a
+screen costs a dictionary lookup and startup reads one file.
+
+NETRUNNER_RENDER=external goes back to the figlet, boxes and lolcat
+programs; if they are missing the native renderer is used instead.
+"""
+import marshal
+import math
+import os
+import sys
+
+from netrunner import catalog, paths
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FONT = os.path.join(HERE, "fonts", "standard.flf")
+RENDERER = os.environ.get("NETRUNNER_RENDER", "native")
+CLEAR = "\033[H\033[2J\033[3J"
+RESET = "\033[0m"
+CACHE_FORMAT = 1
+ESCAPE = r"\033\[[0-9;?]*[A-Za-z]|."
+
+# figlet layout bits (see figfont.txt).
+EQUAL, LOWLINE, HIERARCHY, PAIR, BIGX, HARDBLANK = 1, 2, 4, 8, 16, 32
+KERN, SMUSH = 64, 128
+# Characters of a .flf file: ASCII, then the seven "Deutsch" letters.
+CODES = list(range(32, 127)) + [196, 214, 220, 228, 246, 252, 223]
+
+_fonts = {}
+_cache = {}
+
+
+def columns():
+    # shutil.get_terminal_size(), without importing shutil at startup.
+    try:
+        return int(os.environ["COLUMNS"])
+    except (KeyError, ValueError):
+        pass
+    try:
+        return os.get_terminal_size(sys.__stdout__.fileno()).columns or 80
+    except (AttributeError, ValueError, OSError):
+        return 80
+
+
+def load_font(path=FONT):
+    if path in _fonts:
+        return _fonts[path]
+    with open(path, encoding="latin-1") as f:
+        lines = f.read().splitlines()
+    header = lines[0].split()
+    hardblank = header[0][-1]
+    height = int(header[1])
+    old_layout = int(header[4])
+    comments = int(header[5])
+    if len(header) > 7:
+        layout = int(header[7])
+    elif old_layout < 0:
+        layout = 0
+    elif old_layout == 0:
+        layout = KERN
+    else:
+        layout = (old_layout & 63) | SMUSH
+    glyphs = {}
+    row = comments + 1
+    for code in CODES:
+        glyph = lines[row:row + height]
+        if len(glyph) < height:
+            break
+        glyph = [line.rstrip(line[-1]) if line else line for line in glyph]
+        size = max(len(line) for line in glyph)
+        glyphs[chr(code)] = ([line.ljust(size) for line in glyph], size)
+        row += height
+    font = (hardblank, height, layout, glyphs)
+    _fonts[path] = font
+    return font
+
+
+def smush(left, right, sizes, font):
+    # The character that replaces `left` and `right` when they overlap, or
+    # None if the font's rules keep them apart.
+    hardblank, height, layout, glyphs = font
+    if left == " ":
+        return right
+    if right == " ":
+        return left
+    if min(sizes) < 2 or not layout & SMUSH:
+        return None
+    if not layout & 63:
+        if left == hardblank:
+            return right
+        return left if right == hardblank else right
+    if left == hardblank and right == hardblank:
+        return left if layout & HARDBLANK else None
+    if hardblank in (left, right):
+        return None
+    if layout & EQUAL and left == right:
+        return left
+    if layout & LOWLINE:
+        if left == "_" and right in "|/\\[]{}()<>":
+            return right
+        if right == "_" and left in "|/\\[]{}()<>":
+            return left
+    if layout & HIERARCHY:
+        for low, high in (("|", "/\\[]{}()<>"), ("/\\", "[]{}()<>"), ("[]", "{}()<>"), ("{}", "()<>"), ("()", "<>")):
+            if left in low and right in high:
+                return right
+            if right in low and left in high:
+                return left
+    if layout & PAIR and left + right in ("[]", "][", "{}", "}{", "()", ")("):
+        return "|"
+    if layout & BIGX:
+        return {"/\\": "|", "\\/": "Y", "><": "X"}.get(left + right)
+    return None
+
+
+def overlap(rows, glyph, sizes, font):
+    amount = sizes[1]
+    for left, right in zip(rows, glyph):
+        edge = len(left.rstrip())
+        lead = len(right) - len(right.lstrip())
+        if not edge:
+            gap = len(left) + lead
+        else:
+            gap = len(left) - edge + lead
+            if lead < len(right) and smush(left[edge - 1], right[lead], sizes, font) is not None:
+                gap += 1
+        amount = min(amount, gap)
+    return amount
+
+
+def figlet_line(text, font):
+    hardblank, height, layout, glyphs = font
+    rows = [""] * height
+    previous = 0
+    for char in text:
+        if char not in glyphs:
+            continue
+        glyph, size = glyphs[char]
+        sizes = (previous, size)
+        amount = overlap(rows, glyph, sizes, font) if layout & (KERN | SMUSH) else 0
+        for n, right in enumerate(glyph):
+            left = rows[n]
+            for i in range(amount):
+                at = len(left) - amount + i
+                if at >= 0:
+                    joined = smush(left[at], right[i], sizes, font)
+                    left = left[:at] + (right[i] if joined is None else joined) + left[at + 1:]
+            rows[n] = left + right[amount:]
+        previous = size
+    return [row.replace(hardblank, " ") for row in rows]
+
+
+def figlet(text, width=None, center=True, font=FONT):
+    # Like `figlet -c -w WIDTH`: words wrap onto new rows of letters when a
+    # line would not fit, and every row is centred.
+    font = load_font(font)
+    width = width or columns()
+    blocks = []
+    line = ""
+    for word in text.split():
+        wider = word if not line else line + " " + word
+        if line and len(figlet_line(wider, font)[0]) > width - 1:
+            blocks.append(figlet_line(line, font))
+            line = word
+        else:
+            line = wider
+    blocks.append(figlet_line(line, font))
+    out = []
+    for rows in blocks:
+        indent = " " * max(0, (width - 1 - len(rows[0])) // 2) if center else ""
+        out.extend((indent + row).rstrip() for row in rows)
+    return "\n".join(out) + "\n"
+
+
+def at(column, text):
+    # `text` placed so that its middle character sits on `column`.
+    return " " * (column - len(text) // 2) + text
+
+
+def overlay(line, column, text):
+    return line[:column] + text + line[column + len(text):]
+
+
+def boy(lines, size):
+    width = max(size + 6, 24)
+    middle = width // 2
+    out = [at(middle, part) for part in ('.-"""-.', '/ .===. \\', '\\/ 6 6 \\/', '( \\___/ )')]
+    out.append(overlay("  " + "_" * (width - 4), middle - 8, "ooo__\\_____/"))
+    out.append(" /" + " " * (width - 4) + "\\")
+    out.extend("|  " + line.ljust(width - 6) + "  |" for line in lines)
+    out.append(overlay(" \\" + "_" * (width - 4) + "/", middle + 4, "ooo"))
+    out.extend(at(middle, part) for part in ("|  |  |", "|_ | _|", "|  |  |", "|__|__|", "/-'Y'-\\", "(__/ \\__)"))
+    return out
+
+
+def parchment(lines, size):
+    width = size + 4
+    out = [" " + "_" * (width + 2), "/\\" + " " * (width + 1) + "\\", "\\_|" + " " * width + "|"]
+    out.extend("  |  " + line.ljust(width - 2) + "|" for line in lines)
+    out.append("  |" + " " * width + "|")
+    out.append("  |   " + "_" * (width - 3) + "|_")
+    out.append("   \\_/" + "_" * (width - 1) + "/")
+    return out
+
+
+def headline(lines, size):
+    out = ["/" + "*" * (size + 8) + "/", "/*" + " " * (size + 6) + "*/"]
+    out.extend("/*   " + line.ljust(size) + "   */" for line in lines)
+    out.extend(out[1::-1])
+    return out
+
+
+def comment(lines, size):
+    out = ["/" + "*" * (size + 4) + "/"]
+    out.extend("/* " + line.ljust(size) + " */" for line in lines)
+    out.append(out[0])
+    return out
+
+
+DESIGNS = {"boy": boy, "parchment": parchment, "headline": headline, "default": comment}
+
+
+def frame(text, design="boy"):
+    # What `boxes -d DESIGN` draws around `text`.
+    lines = text.expandtabs(8).split("\n")
+    size = max(len(line) for line in lines)
+    return "\n".join(line.rstrip() for line in DESIGNS[design](lines, size)) + "\n"
+
+
+def colour(i, truecolor):
+    red, green, blue = (int(math.sin(0.1 * i + phase) * 127 + 128) for phase in (0, 2 * math.pi / 3, 4 * math.pi / 3))
+    if truecolor:
+        return "\033[38;2;{0};{1};{2}m".format(red, green, blue)
+    return "\033[38;5;{0}m".format(16 + red * 6 // 256 * 36 + green * 6 // 256 * 6 + blue * 6 // 256)
+
+
+def rainbow(text, seed=None):
+    # lolcat: each row starts one step further along the sine rainbow and
+    # every third column moves it on by one more.
+    import re
+    if seed is None:
+        import random
+        seed = random.randint(0, 255)
+    truecolor = os.environ.get("COLORTERM") in ("truecolor", "24bit")
+    out = []
+    for n, line in enumerate(text.split("\n")):
+        current = None
+        column = 0
+        for token in re.findall(ESCAPE, line):
+            if len(token) > 1:
+                out.append(token)
+                current = None
+                continue
+            if token != " ":
+                code = colour(seed + n + column / 3.0, truecolor)
+                if code != current:
+                    out.append(code)
+                    current = code
+            out.append(token)
+            column += 1
+        out.append("\n")
+    out[-1] = RESET
+    return "".join(out)
+
+
+def external(command, text=None):
+    import subprocess
+    try:
+        done = subprocess.run(command, shell=True, input=text, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True)
+    except OSError:
+        return None
+    return done.stdout if done.returncode == 0 and done.stdout else None
+
+
+def draw_banner(title, width):
+    if RENDERER == "external":
+        import shlex
+        drawn = external("figlet -f standard -c -w {0} {1} | lolcat -f".format(width, shlex.quote(title)))
+        if drawn:
+            return drawn
+    return rainbow(figlet(title, width))
+
+
+def draw_box(text, design="boy", lolcat=True):
+    if RENDERER == "external":
+        command = "boxes" if design == "default" else "boxes -d " + design
+        drawn = external(command + (" | lolcat -f" if lolcat else ""), text + "\n")
+        if drawn:
+            return drawn
+    drawn = frame(text, design)
+    return rainbow(drawn) if lolcat else drawn
+
+
+def load_cache(width):
+    # Everything drawn for this terminal width, read from one file. A new
+    # width, renderer or catalog.json starts an empty cache.
+    current = (CACHE_FORMAT, width, RENDERER, os.environ.get("COLORTERM", ""), catalog.stamp())
+    if _cache.get("stamp") == current:
+        return _cache
+    target = paths.data_path("render.cache")
+    drawn = {}
+    try:
+        with open(target, "rb") as f:
+            cached_stamp, cached = marshal.loads(f.read())
+        if cached_stamp == current:
+            drawn = cached
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    _cache.update(stamp=current, target=target, drawn=drawn)
+    return _cache
+
+
+def cached(key, width, draw, *args):
+    cache = load_cache(width)
+    drawn = cache["drawn"].get(key)
+    if drawn is None:
+        drawn = draw(*args).encode("utf-8")
+        cache["drawn"][key] = drawn
+        try:
+            paths.write_file(cache["target"], marshal.dumps((cache["stamp"], cache["drawn"])))
+        except OSError:
+            pass
+    return drawn
+
+
+def banner(title, width=None):
+    width = width or columns()
+    return cached(("banner", title), width, draw_banner, title, width)
+
+
+def box(text, design="boy", lolcat=True):
+    return cached(("box", text, design, lolcat), columns(), draw_box, text, design, lolcat)
+
+
+def paint(*parts, out=None):
+    # Cached screens are bytes already; the rest is encoded and everything
+    # goes out in one write.
+    out = out or sys.stdout
+    data = b"".join(part if isinstance(part, bytes) else part.encode("utf-8") for part in parts)
+    out.flush()
+    out.buffer.write(data)
+    out.buffer.flush()
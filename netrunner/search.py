@@ -0,0 +1,110 @@
+"""Finding a tool by name, description or upstream URL: the / palette.
+
+A trigram index of every tool in the catalog is built the first time
+anything is searched and kept, as a marshal image next to the compiled
+catalog, until catalog.json changes. A query is split into the same
+trigrams and each tool is scored by the ones it has, those in its name
+counting double, so typos and partial words still find it; a query found
+whole in a tool's name or id ranks first. Looking a query up touches only
+the posting lists of its own trigrams, so it stays well under a
+millisecond however many tools the catalog has.
+"""
+import collections
+import marshal
+import os
+
+from netrunner import catalog, paths
+
+FORMAT = 1
+# The points a tool needs per trigram of the query: 1 is half of them in
+# its name, or all of them elsewhere.
+MATCH = 1
+# What a trigram found in a tool's name or id counts, against 1 elsewhere.
+NAME_WEIGHT = 2
+LOADED = {}
+
+
+def index_path():
+    return os.path.join(os.path.dirname(catalog.compiled_path(catalog.SOURCE)), "search.marshal")
+
+
+def normal(text):
+    # Lower case, with anything but letters and digits as single spaces.
+    return " ".join("".join(c if c.isalnum() else " " for c in text.lower()).split())
+
+
+def trigrams(text):
+    # Each word padded with a space on both sides, so short words and word
+    # starts count too: "xss" is " xs", "xss", "ss ".
+    found = set()
+    for word in normal(text).split():
+        word = " " + word + " "
+        found.update(word[i:i + 3] for i in range(len(word) - 2))
+    return found
+
+
+def build(screens):
+    # {"tools": [(id, name, category, name and id normalised)],
+    #  "names": {trigram: [tool]}, "text": {trigram: [tool]}, "common":
+    # [trigram]}, tools by their position in "tools".
+    menus = {name: spec for name, spec in screens.items() if spec["type"] == "menu"}
+    tools = []
+    names = {}
+    text = {}
+    for position, name in enumerate(sorted(catalog.tools(screens))):
+        spec = screens[name]
+        category = menus.get(spec["category"], {}).get("name") or ""
+        tools.append((name, spec["name"], category, normal(spec["name"] + " " + name)))
+        for gram in trigrams(spec["name"] + " " + name):
+            names.setdefault(gram, []).append(position)
+        for gram in trigrams(" ".join((spec.get("description") or "", spec.get("homepage") or "", spec["repo"] or "", category))):
+            text.setdefault(gram, []).append(position)
+    # Trigrams most tools have, from "https" and "github" to "ion", say
+    # nothing about which one is meant and have the longest lists.
+    common = [gram for gram, found in text.items() if len(found) > len(tools) // 4]
+    for gram in common:
+        del text[gram]
+    return {"tools": tools, "names": names, "text": text, "common": common}
+
+
+def index():
+    current = (FORMAT,) + catalog.stamp()
+    if LOADED.get("stamp") == current:
+        return LOADED["index"]
+    target = index_path()
+    try:
+        with open(target, "rb") as f:
+            cached_stamp, built = marshal.loads(f.read())
+        if cached_stamp != current:
+            raise ValueError("stale")
+    except (OSError, EOFError, ValueError, TypeError):
+        built = build(catalog.load())
+        try:
+            paths.write_file(target, marshal.dumps((current, built)))
+        except OSError:
+            pass
+    LOADED.update(stamp=current, index=built)
+    return built
+
+
+def find(query, limit=9):
+    # [(id, name, category)] of the tools that match, best first.
+    built = index()
+    query = normal(query)
+    if not query:
+        return []
+    grams = trigrams(query).difference(built["common"]) or trigrams(query)
+    scores = collections.Counter()
+    for gram in grams:
+        for position in built["names"].get(gram, ()):
+            scores[position] += NAME_WEIGHT
+        scores.update(built["text"].get(gram, ()))
+    ranked = []
+    for position, score in scores.items():
+        name, label, category, words = built["tools"][position]
+        # Whole matches come before everything else.
+        whole = query in words
+        if whole or score >= MATCH * len(grams):
+            ranked.append((not whole, -score, label.lower(), position))
+    ranked.sort()
+    return [built["tools"][position][:3] for whole, score, label, position in ranked[:limit]]
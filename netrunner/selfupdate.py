@@ -0,0 +1,173 @@
+"""Updating Netrunner itself without ever leaving it half installed.
+
+    /opt/Netrunner/repo.git          shallow bare clone of Netrunner
+    /opt/Netrunner/versions/<sha>/   one directory per installed revision
+    /opt/Netrunner/current  -> versions/<sha>
+    /opt/Netrunner/previous -> versions/<sha>
+
+An update fetches the newest revision into repo.git, unpacks it into a new
+versions/ directory, byte-compiles it and compiles its catalog, and only
+then points `current` at it with a rename, which is atomic. Until that
+rename the old version is untouched and in use; when anything before it
+fails the new directory is thrown away. The replaced version stays as
+`previous`, so rolling back is one more rename. The /usr/bin/Netrunner
+wrapper starts whatever `current` resolves to when it is run, so a running
+Netrunner keeps its own version to the end; /usr/bin/netrunnerd starts the
+daemon (see daemon.py) the same way.
+
+NETRUNNER_ROOT and NETRUNNER_SOURCE change where Netrunner is installed
+and where it is fetched from.
+
+    python3 -m netrunner.selfupdate [--rollback]
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import time
+
+ROOT = os.environ.get("NETRUNNER_ROOT", "/opt/Netrunner")
+SOURCE = os.environ.get("NETRUNNER_SOURCE", "https://github.com/MiChaelinzo/CyberPunkNetrunner.git")
+WRAPPER = "/usr/bin/Netrunner"
+# Versions kept besides current and previous.
+KEEP = 2
+
+
+class UpdateError(Exception):
+    pass
+
+
+def git(args):
+    found = subprocess.run(["git"] + args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if found.returncode:
+        raise UpdateError("git {0} failed: {1}".format(args[0] if args[0] != "-C" else args[2], found.stderr.strip()))
+    return found.stdout.strip()
+
+
+def version(name):
+    # The revision a symlink under ROOT points at, or None.
+    try:
+        return os.path.basename(os.readlink(os.path.join(ROOT, name)))
+    except OSError:
+        return None
+
+
+def fetch():
+    # The newest revision of SOURCE, in repo.git.
+    repo = os.path.join(ROOT, "repo.git")
+    if not os.path.isdir(repo):
+        git(["init", "--quiet", "--bare", repo])
+    git(["-C", repo, "fetch", "--quiet", "--depth", "1", SOURCE, "HEAD"])
+    return repo, git(["-C", repo, "rev-parse", "FETCH_HEAD"])[:12]
+
+
+def unpack(repo, sha, target):
+    tmp = target + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    try:
+        archive = subprocess.Popen(["git", "-C", repo, "archive", "--format=tar", sha], stdout=subprocess.PIPE)
+        with tarfile.open(fileobj=archive.stdout, mode="r|") as tar:
+            tar.extractall(tmp)
+        if archive.wait():
+            raise UpdateError("git archive failed")
+        # Compiled by the new version's own code, with the paths it will
+        # have once it is renamed into place.
+        for command in ([sys.executable, "-m", "compileall", "-q", "-j", "0", "-d", target, "."],
+                        [sys.executable, "-m", "netrunner.catalog"]):
+            if subprocess.run(command, cwd=tmp, stdout=subprocess.DEVNULL).returncode:
+                raise UpdateError("{0} failed in the new version".format(" ".join(command[1:3])))
+        os.replace(tmp, target)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def point(name, sha):
+    link = os.path.join(ROOT, name)
+    if os.path.lexists(link + ".tmp"):
+        os.remove(link + ".tmp")
+    os.symlink(os.path.join("versions", sha), link + ".tmp")
+    os.replace(link + ".tmp", link)
+
+
+def wrapper():
+    # Resolved when Netrunner starts, so a later swap does not pull a newer
+    # version's modules into a running one.
+    current = os.path.join(ROOT, "current")
+    scripts = {
+        WRAPPER: '#!/bin/bash\nexec python3 "$(readlink -f {0})/Netrunner.py" "$@"\n'.format(current),
+        os.path.join(os.path.dirname(WRAPPER), "netrunnerd"): '#!/bin/bash\ncd "$(readlink -f {0})" && exec python3 -m netrunner.daemon "$@"\n'.format(current),
+    }
+    for path, script in scripts.items():
+        try:
+            with open(path) as f:
+                if f.read() == script:
+                    continue
+        except OSError:
+            pass
+        try:
+            with open(path + ".tmp", "w") as f:
+                f.write(script)
+            os.chmod(path + ".tmp", 0o755)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print("Netrunner: could not write {0}: {1}".format(path, e), file=sys.stderr)
+
+
+def prune():
+    versions = os.path.join(ROOT, "versions")
+    keep = {version("current"), version("previous")}
+    old = sorted((entry for entry in os.listdir(versions) if entry not in keep and not entry.endswith(".tmp")),
+                 key=lambda entry: os.path.getmtime(os.path.join(versions, entry)), reverse=True)
+    for entry in old[KEEP:]:
+        shutil.rmtree(os.path.join(versions, entry), ignore_errors=True)
+
+
+def update():
+    # {"from", "to", "changed", "seconds"}; raises UpdateError and leaves
+    # the installed version alone when anything goes wrong.
+    start = time.time()
+    os.makedirs(os.path.join(ROOT, "versions"), exist_ok=True)
+    old = version("current")
+    repo, sha = fetch()
+    if sha != old:
+        target = os.path.join(ROOT, "versions", sha)
+        if not os.path.isdir(target):
+            unpack(repo, sha, target)
+        if old:
+            point("previous", old)
+        point("current", sha)
+    wrapper()
+    prune()
+    return {"from": old, "to": sha, "changed": sha != old, "seconds": round(time.time() - start, 3)}
+
+
+def rollback():
+    old, previous = version("current"), version("previous")
+    if not previous or not os.path.isdir(os.path.join(ROOT, "versions", previous)):
+        raise UpdateError("there is no previous version to go back to")
+    point("current", previous)
+    point("previous", old)
+    return {"from": old, "to": previous, "changed": True, "seconds": 0.0}
+
+
+def describe(result):
+    if not result["changed"]:
+        return "Netrunner is up to date ({0})".format(result["to"])
+    return "Netrunner {0} -> {1} in {2:.1f}s".format(result["from"] or "(new install)", result["to"], result["seconds"])
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        print(describe(rollback() if "--rollback" in argv else update()))
+    except (UpdateError, OSError) as e:
+        print("Netrunner: update failed, nothing was changed: {0}".format(e), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
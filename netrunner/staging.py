@@ -0,0 +1,86 @@
+"""Installing a tool into place all at once, one Netrunner at a time.
+
+A tool's install steps do not run in the tools directory but in a staging
+directory of its own, .netrunner/staging/<tool>, on the same file system:
+its clone lands there and its `cd <tool> && ...` steps build there. Only
+when every step has succeeded is what they made renamed into the tools
+directory, so a tool's directory is either missing or complete, never a
+half-finished clone that looks installed. Reinstalling a tool swaps the
+old directory out and the new one in with two renames, and then removes
+the old one.
+
+A failed or interrupted install leaves nothing in the tools directory.
+Its staging directory stays where it is for the next install to resume in
+(see steps.py), and is discarded when that one starts and there is nothing
+left to resume.
+
+Installs and updates of a tool hold a lock on .netrunner/locks/<tool>.lock
+while they run, so two Netrunners, or two installs in one, take turns on
+the same tool.
+"""
+import os
+import shutil
+
+from netrunner import paths, state
+
+
+def staging_dir(tool):
+    return paths.data_path("staging", tool)
+
+
+def locked(tool, log=None):
+    return paths.locked(paths.data_path("locks", tool + ".lock"),
+                        busy=lambda: print(" Waiting for another Netrunner that is installing {0}".format(tool), file=log, flush=True))
+
+
+def begin(tool):
+    # The staging directory to run the tool's install steps in; call with
+    # the lock held.
+    root = staging_dir(tool)
+    if os.path.isdir(root) and not state.checkpoints(tool):
+        # Left by an install nothing can resume from.
+        shutil.rmtree(root, ignore_errors=True)
+    os.makedirs(root, exist_ok=True)
+    return root
+
+
+def move(source, target):
+    try:
+        os.rename(source, target)
+    except OSError:
+        # The tools directory is on another file system after all.
+        shutil.move(source, target)
+
+
+def finish(tool, log=None):
+    # Puts what the install steps made into the tools directory; returns 0,
+    # or 1 when it could not.
+    root = staging_dir(tool)
+    try:
+        for name in sorted(os.listdir(root)):
+            target = os.path.join(paths.tools_dir(), name)
+            old = None
+            if os.path.lexists(target):
+                old = os.path.join(os.path.dirname(root), ".{0}.{1}.old".format(name, os.getpid()))
+                move(target, old)
+            move(os.path.join(root, name), target)
+            if old and os.path.isdir(old) and not os.path.islink(old):
+                shutil.rmtree(old, ignore_errors=True)
+            elif old:
+                os.remove(old)
+        os.rmdir(root)
+    except OSError as e:
+        print(" Could not move {0} into place: {1}".format(tool, e), file=log)
+        return 1
+    return 0
+
+
+def install(spec, action_steps, check=False, log=None, venv=None):
+    # steps.run() for a tool's install steps, staged and under its lock.
+    from netrunner import steps
+    with locked(spec["id"], log):
+        if not spec["dir"]:
+            # Tools without a clone only install packages: nothing to stage.
+            return steps.run(action_steps, check=check, log=log, venv=venv, checkpoint=spec["id"])
+        status = steps.run(action_steps, check=check, log=log, venv=venv, checkpoint=spec["id"], cwd=begin(spec["id"]))
+        return status or finish(spec["id"], log)
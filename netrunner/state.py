@@ -0,0 +1,219 @@
+"""What Netrunner has installed, and how it went.
+
+One SQLite database, .netrunner/state.db in the tools directory, keeps a
+row per tool: where it was cloned from and to, the commit checked out and
+the one its install steps last ran on, how long the install took and how
+it ended, and when the tool last ran. The
+installer, the menus and the command line write it as they go, one
+transaction per tool, and a menu reads the badges of all its tools with one
+query on the primary key instead of looking for every clone on disk. A
+second table, runs, keeps a row per job (see jobs.py) with what it used:
+CPU seconds, peak RSS and bytes read and written, under which limits. A
+third, builds, keeps a row per build command (see builds.py): how long it
+took and whether it came from the build cache. A fourth, checkpoints,
+keeps the install steps of each tool that have finished, until the install
+as a whole has (see steps.py), so a failed or interrupted one resumes where
+it stopped.
+
+Tools installed before the database existed are picked up once, when it is
+created, from the clones found in the tools directory.
+"""
+import contextlib
+import os
+import sqlite3
+import time
+
+from netrunner import paths
+
+SCHEMA = """CREATE TABLE IF NOT EXISTS tools (
+    tool TEXT PRIMARY KEY,
+    path TEXT,
+    url TEXT,
+    sha TEXT,
+    built TEXT,
+    installed REAL,
+    seconds REAL,
+    status INTEGER,
+    last_run REAL,
+    run_status INTEGER
+)"""
+RUNS = """CREATE TABLE IF NOT EXISTS runs (
+    tool TEXT,
+    action TEXT,
+    started REAL,
+    seconds REAL,
+    status INTEGER,
+    cpu_seconds REAL,
+    peak_rss INTEGER,
+    read_bytes INTEGER,
+    written_bytes INTEGER,
+    limits TEXT
+)"""
+BUILDS = """CREATE TABLE IF NOT EXISTS builds (
+    path TEXT,
+    command TEXT,
+    key TEXT,
+    started REAL,
+    seconds REAL,
+    status INTEGER,
+    cached INTEGER
+)"""
+CHECKPOINTS = """CREATE TABLE IF NOT EXISTS checkpoints (
+    tool TEXT,
+    step TEXT,
+    finished REAL,
+    PRIMARY KEY (tool, step)
+)"""
+COLUMNS = ("tool", "path", "url", "sha", "built", "installed", "seconds", "status", "last_run", "run_status")
+MARKS = {True: "✔", False: "✘"}
+
+
+def db_path():
+    return paths.data_path("state.db")
+
+
+@contextlib.contextmanager
+def transaction():
+    os.makedirs(os.path.dirname(db_path()), exist_ok=True)
+    with contextlib.closing(sqlite3.connect(db_path(), timeout=30)) as db:
+        with db:
+            db.execute(SCHEMA)
+            db.execute(RUNS)
+            db.execute(BUILDS)
+            db.execute(CHECKPOINTS)
+            # Databases from before a column was added get it here.
+            known = {row[1] for row in db.execute("PRAGMA table_info(tools)")}
+            for column in COLUMNS:
+                if column not in known:
+                    db.execute("ALTER TABLE tools ADD COLUMN " + column)
+            yield db
+
+
+def head(directory):
+    # The commit checked out in a clone, or None.
+    if not directory or not os.path.isdir(os.path.join(directory, ".git")):
+        return None
+    import subprocess
+    found = subprocess.run(["git", "-C", directory, "rev-parse", "HEAD"], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    return found.stdout.strip() or None
+
+
+def upsert(db, tool, **values):
+    names = ["tool"] + list(values)
+    db.execute("INSERT INTO tools ({0}) VALUES ({1}) ON CONFLICT(tool) DO UPDATE SET {2}".format(
+        ", ".join(names), ", ".join("?" * len(names)), ", ".join("{0} = excluded.{0}".format(name) for name in values)),
+        [tool] + list(values.values()))
+
+
+def installed(tool, url, directory, status, seconds):
+    path = os.path.abspath(directory) if directory else None
+    sha = head(directory) if status == 0 else None
+    with transaction() as db:
+        upsert(db, tool, path=path, url=url, sha=sha, built=sha, installed=time.time(), seconds=round(seconds, 3), status=status)
+        if status == 0:
+            # Installed: the next install starts from the first step.
+            db.execute("DELETE FROM checkpoints WHERE tool = ?", (tool,))
+
+
+def updated(tool, directory, status, built=False):
+    # built: the install steps ran again on the new commit.
+    if status == 0:
+        sha = head(directory)
+        with transaction() as db:
+            if built:
+                upsert(db, tool, sha=sha, built=sha)
+                db.execute("DELETE FROM checkpoints WHERE tool = ?", (tool,))
+            else:
+                upsert(db, tool, sha=sha)
+
+
+def ran(tool, status):
+    with transaction() as db:
+        upsert(db, tool, last_run=time.time(), run_status=status)
+
+
+def measured(tool, action, started, seconds, status, usage, limits):
+    import json
+    with transaction() as db:
+        db.execute("INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", (
+            tool, action, started, round(seconds, 3), status, round(usage["cpu_seconds"], 3), usage["peak_rss"],
+            usage["read_bytes"], usage["written_bytes"], json.dumps(limits, sort_keys=True) if limits else None))
+
+
+def compiled(path, command, key, started, seconds, status, cached):
+    with transaction() as db:
+        db.execute("INSERT INTO builds VALUES (?, ?, ?, ?, ?, ?, ?)", (path, command, key, started, round(seconds, 3), status, int(cached)))
+
+
+def checkpoints(tool):
+    # The markers of the tool's install steps that have finished.
+    if not os.path.exists(db_path()):
+        return set()
+    try:
+        with contextlib.closing(sqlite3.connect(db_path(), timeout=30)) as db:
+            return {row[0] for row in db.execute("SELECT step FROM checkpoints WHERE tool = ?", (tool,))}
+    except sqlite3.Error:
+        return set()
+
+
+def reached(tool, marks):
+    now = time.time()
+    with transaction() as db:
+        db.executemany("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)", [(tool, mark, now) for mark in marks])
+
+
+def tools(names=None):
+    # {tool: row} of the named tools (or all of them) that have a row. An
+    # unreadable database reads as empty: the badges are only a hint.
+    if not os.path.exists(db_path()):
+        return {}
+    query = "SELECT {0} FROM tools".format(", ".join(COLUMNS))
+    if names is not None:
+        names = list(names)
+        query += " WHERE tool IN ({0})".format(", ".join("?" * len(names)))
+    try:
+        with contextlib.closing(sqlite3.connect(db_path(), timeout=30)) as db:
+            return {row[0]: dict(zip(COLUMNS, row)) for row in db.execute(query, names or [])}
+    except sqlite3.Error:
+        return {}
+
+
+def is_installed(row):
+    # True, False after a failed install, None when it was never installed.
+    if not row or row["status"] is None:
+        return None
+    return row["status"] == 0
+
+
+def version(row):
+    return row["sha"][:7] if row and row["sha"] else None
+
+
+def badge(row):
+    ok = is_installed(row)
+    if ok is None:
+        return ""
+    return " ".join(filter(None, [MARKS[ok], version(row) if ok else None]))
+
+
+def adopt(screens):
+    # Called on start: brings the table up to date, and the first time
+    # records the clones already on disk.
+    fresh = not os.path.exists(db_path())
+    with transaction() as db:
+        if not fresh:
+            return
+        for name, spec in screens.items():
+            if spec["type"] == "tool" and spec["dir"] and os.path.isdir(spec["dir"]):
+                sha = head(spec["dir"])
+                upsert(db, name, path=os.path.abspath(spec["dir"]), url=spec["repo"], sha=sha, built=sha,
+                       installed=os.path.getmtime(spec["dir"]), status=0)
+
+
+def not_installed(spec, action_steps):
+    # Whether these steps cd into the tool's clone and it is not there.
+    if not spec["dir"] or os.path.isdir(spec["dir"]):
+        return False
+    import re
+    into = re.compile(r"\bcd\s+" + re.escape(spec["dir"]) + r"/?(\s|;|&|$)")
+    return any(isinstance(step, str) and into.search(step) for step in action_steps)
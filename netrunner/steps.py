@@ -0,0 +1,172 @@
+"""Running the install, run and action steps of a catalog tool.
+
+A step is a shell command (with {name} filled in from earlier answers) or
+one of the small dicts catalog.json uses: run (a shell command with a
+"timeout" in seconds), clone, ask, box, print, sleep, open and call. Shell
+commands are started by executor.py, which gives pip installs the local
+wheelhouse when there is one (wheelhouse.py) and wraps builds in the build
+cache (builds.py); clones go through the local mirror cache in mirror.py.
+Given a venv (see venvs.py), the steps run in it. The menus and the
+command line both run steps through here.
+
+Install steps are checkpointed: each command and clone that succeeds is
+marked done in the state database under its tool, by its own text. A step
+of several commands marks each of them, after the cd it needs, as the
+install plan splits them (see plan.py), so an install from the menus and
+one from the command line resume each other. When an install fails or is
+cut short with Ctrl-C, the next one skips the steps at the start that
+are marked done (a clone only while its directory is still there) and
+resumes at the first one that is not, and from there runs everything
+again. Questions, messages and pauses are not checkpointed and always run.
+The marks are dropped once the tool is installed, so a later reinstall
+starts over.
+"""
+import contextlib
+import json
+import os
+import re
+import threading
+import time
+
+from netrunner import builds, executor, mirror, plan, render, state, venvs, wheelhouse
+
+PACKAGE_MANAGER = re.compile(r"\b(apt-get|apt|dpkg|pip3?|gem)\b")
+# The ones a venv does not keep to itself.
+SYSTEM_PACKAGES = re.compile(r"\b(apt-get|apt|dpkg|gem)\b")
+PACKAGE_LOCK = threading.Lock()
+NO_LOCK = contextlib.nullcontext()
+executor.REWRITES.extend([venvs.rewrite, wheelhouse.offline])
+executor.WRAPPERS.append(builds.cached)
+
+
+def questions(steps):
+    return [step["as"] for step in steps if isinstance(step, dict) and "ask" in step]
+
+
+def shell(command, answers=None, log=None, timeout=None, venv=None, cwd=None):
+    # Package managers hold system-wide locks, so when tools are installed
+    # side by side their commands still take turns; pip in a venv does not
+    # need to.
+    shared = (SYSTEM_PACKAGES if venv else PACKAGE_MANAGER).search(command)
+    with PACKAGE_LOCK if shared else NO_LOCK:
+        return executor.run(command, answers, cwd, timeout, log, venvs.environment(venv) if venv else None)["status"]
+
+
+def checkpointed(step):
+    # Commands and clones; the rest are cheap to repeat.
+    return isinstance(step, str) or "run" in step or "clone" in step
+
+
+def clone_dir(step, cwd=None):
+    return os.path.join(cwd or "", step.get("dir") or mirror.checkout_name(step["clone"]))
+
+
+def marks(step):
+    # What marks a step done: its commands, or the clone or run itself.
+    if isinstance(step, str):
+        return plan.placed(step)
+    return [json.dumps(step, sort_keys=True)]
+
+
+def present(step, cwd=None):
+    # Whether what a finished step left behind is still there.
+    if isinstance(step, dict) and "clone" in step:
+        return os.path.isdir(clone_dir(step, cwd))
+    return True
+
+
+def run(steps, answers=None, check=False, log=None, venv=None, checkpoint=None, cwd=None):
+    # Returns the exit status of the first command that failed, or 0. The
+    # menus keep going after a failure as they always have; check=True
+    # stops there instead. With a log file, commands and messages go there
+    # instead of the terminal. checkpoint: the tool whose install these
+    # steps are, to resume it after the steps that are done. cwd: where
+    # commands run and clones go, when not the tools directory (see
+    # staging.py).
+    answers = dict(answers or {})
+    failed = 0
+    done = state.checkpoints(checkpoint) if checkpoint else set()
+    skipped = 0
+    for step in steps:
+        status = 0
+        mark = None
+        rest = None
+        if checkpoint and checkpointed(step):
+            mark = marks(step)
+            if done and done.issuperset(mark) and present(step, cwd):
+                skipped += 1
+                continue
+            if done and isinstance(step, str) and mark[0] in done:
+                # The install plan ran this step's first commands on their
+                # own last time: the others are left.
+                rest = mark[[command in done for command in mark].index(False):]
+            if done and (skipped or rest):
+                print(" Resuming the install of {0}: {1} steps were done already".format(checkpoint, skipped), file=log)
+            # From the first step that runs on, they all do.
+            done = set()
+        if rest:
+            for command in rest:
+                status = shell(command, answers, log, venv=venv, cwd=cwd)
+                if status:
+                    break
+                state.reached(checkpoint, [command])
+        elif isinstance(step, str):
+            status = shell(step, answers, log, venv=venv, cwd=cwd)
+        elif "run" in step:
+            status = shell(step["run"], answers, log, step.get("timeout"), venv, cwd)
+        elif "clone" in step:
+            status = mirror.clone(step["clone"], clone_dir(step, cwd), step.get("strategy"), step.get("sparse"), log)
+        elif "ask" in step:
+            if step["as"] not in answers:
+                answers[step["as"]] = input(step["ask"])
+        elif "box" in step and log:
+            log.write(render.frame(step["box"], step.get("style", "boy")))
+        elif "box" in step:
+            render.paint(render.box(step["box"], step.get("style", "boy"), step.get("lolcat", True)))
+        elif "print" in step:
+            print(step["print"], file=log)
+        elif "sleep" in step:
+            time.sleep(step["sleep"])
+        elif "open" in step:
+            import webbrowser
+            webbrowser.open_new_tab(step["open"])
+        elif "call" in step:
+            HANDLERS[step["call"]](answers)
+        if mark and not status:
+            state.reached(checkpoint, mark)
+        if status:
+            failed = failed or status
+            if check:
+                break
+    if venv:
+        # Whatever pip put in the venv, the store shares.
+        venvs.share(venv)
+    return failed
+
+
+def h2ip(answers):
+    import socket
+    print(socket.gethostbyname(answers["host"]))
+
+
+def update_tools(answers):
+    from netrunner import catalog, updater
+    specs = updater.installed(catalog.load())
+    start = time.time()
+    results = updater.update(specs, progress=lambda done, count, total: print("[{0}/{1}] {2}".format(count, total, done["tool"]), flush=True))
+    print(updater.summary(results, time.time() - start))
+
+
+def self_update(answers):
+    from netrunner import selfupdate
+    if selfupdate.main([]) == 0:
+        print("Restart Netrunner to use the new version.")
+
+
+def self_rollback(answers):
+    from netrunner import selfupdate
+    if selfupdate.main(["--rollback"]) == 0:
+        print("Restart Netrunner to use it.")
+
+
+HANDLERS = {"h2ip": h2ip, "update_tools": update_tools, "self_update": self_update, "self_rollback": self_rollback}
@@ -0,0 +1,151 @@
+"""Updating installed tools in place.
+
+A tool is updated with `git fetch` and a fast-forward of its clone, never by
+deleting and cloning it again, and tools are updated side by side on a
+pool of worker threads. Before fetching, the remote's HEAD is compared with
+the clone's: tools whose remote has not moved are skipped without a fetch.
+The remote heads are kept for NETRUNNER_REMOTE_TTL seconds in
+.netrunner/remote-heads.json, so running update twice in a row asks no
+server anything the second time.
+
+Fetching new commits does not rebuild a tool. Tools with install steps
+besides their clone whose HEAD is no longer the commit those steps last ran
+on (see state.py) are reported, and --rebuild runs the steps again for
+them. A tool is updated under the same lock as its installs (see
+staging.py).
+"""
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from netrunner import catalog, installer, mirror, paths, staging, state, steps, venvs
+
+TTL = float(os.environ.get("NETRUNNER_REMOTE_TTL", "600"))
+
+
+def heads_path():
+    return paths.data_path("remote-heads.json")
+
+
+def load_heads():
+    try:
+        with open(heads_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def git(directory, args, log):
+    log.write("$ git -C {0} {1}\n".format(directory, " ".join(args)))
+    log.flush()
+    found = subprocess.run(["git", "-C", directory] + args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=log, text=True)
+    log.write(found.stdout)
+    return found.returncode, found.stdout.strip()
+
+
+def installed(screens):
+    # The tools installed from git, as the state database has it.
+    rows = state.tools()
+    return [screens[name] for name in catalog.tools(screens) if state.version(rows.get(name)) and os.path.isdir(screens[name]["dir"])]
+
+
+def post_install(spec):
+    # The install steps that come after the clone, or [] when the clone is
+    # all there is to installing the tool.
+    for kind, action_steps, then in spec["choices"].values():
+        if kind == "install":
+            rest = [step for step in action_steps if not (isinstance(step, dict) and "clone" in step)]
+            return rest if any(isinstance(step, str) for step in rest) else []
+    return []
+
+
+def update_tool(spec, row, heads, lock, rebuild=False):
+    start = time.time()
+    directory = spec["dir"]
+    result = {"tool": spec["id"], "action": "update", "ok": True, "status": 0, "changed": False, "rebuild": False}
+    with open(installer.log_path(spec["id"]), "a") as log, staging.locked(spec["id"], log):
+        status, old = git(directory, ["rev-parse", "HEAD"], log)
+        result["old"] = old or None
+        with lock:
+            known = heads.get(spec["repo"])
+        if known and time.time() - known["checked"] < TTL:
+            remote = known["sha"]
+        else:
+            status, found = git(directory, ["ls-remote", "origin", "HEAD"], log)
+            remote = found.split()[0] if status == 0 and found else None
+            if remote:
+                with lock:
+                    heads[spec["repo"]] = {"sha": remote, "checked": time.time()}
+        if remote != old:
+            if remote:
+                # Or a reinstall within the mirror's TTL would check out
+                # the commit the tool is leaving.
+                mirror.stale(spec["repo"])
+            for args in (["fetch", "--quiet", "origin"], ["merge", "--ff-only", "--quiet", "@{upstream}"]):
+                status, output = git(directory, args, log)
+                if status:
+                    result.update(ok=False, status=status, failed="git " + args[0])
+                    break
+        status, new = git(directory, ["rev-parse", "HEAD"], log)
+        result["new"] = new or None
+        result["changed"] = result["new"] != result["old"]
+        if result["changed"]:
+            result["commits"] = git(directory, ["rev-list", "--count", "{0}..{1}".format(old, new)], log)[1]
+        built = (row or {}).get("built") or old
+        result["rebuild"] = bool(new and new != built and post_install(spec))
+        rebuilt = False
+        if rebuild and result["rebuild"] and result["ok"]:
+            status = steps.run(post_install(spec), check=True, log=log, venv=venvs.for_tool(spec, create=True), checkpoint=spec["id"])
+            rebuilt = status == 0
+            result["rebuild"] = not rebuilt
+            if status:
+                result.update(ok=False, status=status, failed="install steps")
+    state.updated(spec["id"], directory, result["status"], rebuilt)
+    result["seconds"] = round(time.time() - start, 3)
+    result["log"] = installer.log_path(spec["id"])
+    return result
+
+
+def update(specs, workers=installer.JOBS, rebuild=False, progress=None):
+    # One result per tool, in order; progress(result, done, total) as each
+    # tool finishes.
+    os.makedirs(os.path.dirname(installer.log_path("update")), exist_ok=True)
+    for spec in specs:
+        open(installer.log_path(spec["id"]), "w").close()
+    heads = load_heads()
+    rows = state.tools(spec["id"] for spec in specs)
+    lock = threading.Lock()
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(update_tool, spec, rows.get(spec["id"]), heads, lock, rebuild) for spec in specs]
+        for future in futures:
+            results.append(future.result())
+            if progress:
+                progress(results[-1], len(results), len(specs))
+    paths.write_file(heads_path(), json.dumps(heads).encode("utf-8"))
+    return results
+
+
+def short(sha):
+    # None when git rev-parse failed.
+    return sha[:7] if sha else "unknown"
+
+
+def summary(results, elapsed):
+    changed = [done for done in results if done["changed"]]
+    failed = [done for done in results if not done["ok"]]
+    unchanged = [done for done in results if done["ok"] and not done["changed"]]
+    lines = ["\nupdated {0} of {1} tools in {2:.1f}s ({3} unchanged, {4} failed)".format(
+        len(changed), len(results), elapsed, len(unchanged), len(failed))]
+    for done in changed:
+        lines.append("  {0:<20} {1} -> {2} (+{3})".format(done["tool"], short(done["old"]), short(done["new"]), done["commits"] or "?"))
+    for done in failed:
+        lines.append("  {0:<20} failed at {1}, see {2}".format(done["tool"], done["failed"], done["log"]))
+    rerun = [done["tool"] for done in results if done["rebuild"]]
+    if rerun:
+        lines.append("\nre-run the install steps of: " + " ".join(rerun))
+        lines.append("  Netrunner update --rebuild " + " ".join(rerun))
+    return "\n".join(lines)
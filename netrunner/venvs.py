@@ -0,0 +1,197 @@
+"""A virtualenv of its own for every Python tool.
+
+Tools whose install steps run pip (or setup.py install) get a venv under
+.netrunner/venvs/<tool>, created on their first install with `python3 -m
+venv --without-pip --system-site-packages`, which takes a fraction of a
+second; apt's Python packages stay visible, while what the tool installs
+itself, at the versions it pins, stays out of everyone else's way. The
+tool's steps run with the venv first on PATH, and a rewrite in the
+executor points python, python3, pip and pip3, and the scripts the tool
+installed into the venv's bin, at the venv, even after sudo (whose
+secure_path leaves the venv out). pip comes from the interpreter Netrunner
+runs on, with --python; only when that one has no pip does each venv get
+its own.
+
+What pip installed into a venv is then shared through a content-addressed
+store, .netrunner/store/: every file its dist-info RECORD lists is
+hardlinked to the store's copy of the same content, by the hash pip
+recorded (or, for the few files it lists without one, their own). The
+same version of a package in twenty venvs takes the disk space of one.
+Like any hardlinked install, a file edited in place in one venv changes in
+all of them.
+
+NETRUNNER_VENVS=off installs Python tools into the system's Python as
+before. A tool installed before it had a venv keeps running without one.
+"""
+import base64
+import hashlib
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+
+from netrunner import executor, paths
+
+ENABLED = os.environ.get("NETRUNNER_VENVS", "on") != "off"
+PYTHON = re.compile(r"python(3(\.\d+)?)?$")
+PIP = re.compile(r"pip(3(\.\d+)?)?$")
+# In each venv: the dist-infos it already shares through the store.
+SHARED = ".netrunner-shared.json"
+
+
+def venv_dir(tool):
+    return paths.data_path("venvs", tool)
+
+
+def store_dir():
+    return paths.data_path("store")
+
+
+def interpreter(venv):
+    return os.path.join(venv, "bin", "python")
+
+
+def command(step):
+    # The words of each command in a step, without sudo.
+    from netrunner import plan
+    for part in plan.split_commands(step):
+        try:
+            words = shlex.split(part)
+        except ValueError:
+            continue
+        yield words[executor.after_sudo(words):]
+
+
+def wanted(spec):
+    # Whether the tool installs Python packages, and so gets a venv.
+    for step in spec.get("install", []):
+        if not isinstance(step, str):
+            continue
+        for words in command(step):
+            if words and (PIP.match(os.path.basename(words[0])) or "setup.py" in words[1:2]
+                          or (PYTHON.match(os.path.basename(words[0])) and words[1:3] == ["-m", "pip"])):
+                return True
+    return False
+
+
+def for_tool(spec, create=False):
+    # The tool's venv, made first when create is true; None when it has
+    # none.
+    if not ENABLED or not spec.get("id") or not wanted(spec):
+        return None
+    venv = venv_dir(spec["id"])
+    if os.path.isfile(interpreter(venv)):
+        return venv
+    if not create:
+        return None
+    import importlib.util
+    os.makedirs(os.path.dirname(venv), exist_ok=True)
+    options = ["--system-site-packages"]
+    if importlib.util.find_spec("pip"):
+        options.append("--without-pip")
+    status = subprocess.call([sys.executable, "-m", "venv"] + options + [venv], stdin=subprocess.DEVNULL)
+    return venv if status == 0 else None
+
+
+def environment(venv):
+    # The environment the tool's commands run in.
+    env = dict(os.environ, VIRTUAL_ENV=venv, PATH=os.path.join(venv, "bin") + os.pathsep + os.environ.get("PATH", ""))
+    env.pop("PYTHONHOME", None)
+    return env
+
+
+def rewrite(argv, cwd, env):
+    # An executor rewrite: python, pip and the scripts in the venv's bin,
+    # also after sudo, are the venv's.
+    venv = (env or {}).get("VIRTUAL_ENV")
+    if not venv or not argv:
+        return argv
+    at = executor.after_sudo(argv)
+    if at >= len(argv):
+        return argv
+    name = os.path.basename(argv[at])
+    if PIP.match(name):
+        rest = argv[at + 1:]
+    elif PYTHON.match(name) and argv[at + 1:at + 3] == ["-m", "pip"]:
+        rest = argv[at + 3:]
+    elif PYTHON.match(name):
+        return argv[:at] + [interpreter(venv)] + argv[at + 1:]
+    elif "/" not in argv[at] and os.path.isfile(os.path.join(venv, "bin", name)):
+        # A console script, as `sudo wifite`.
+        return argv[:at] + [os.path.join(venv, "bin", name)] + argv[at + 1:]
+    else:
+        return argv
+    if os.path.exists(os.path.join(venv, "bin", "pip")):
+        return argv[:at] + [interpreter(venv), "-m", "pip"] + rest
+    return argv[:at] + [sys.executable, "-m", "pip", "--python", interpreter(venv)] + rest
+
+
+def share(venv):
+    # Hardlinks what pip has installed into the venv since the last time
+    # with the store's copies; returns the bytes that are now shared.
+    done_path = os.path.join(venv, SHARED)
+    try:
+        with open(done_path) as f:
+            done = set(json.load(f))
+    except (OSError, ValueError):
+        done = set()
+    saved = 0
+    for site in sites(venv):
+        for entry in sorted(os.listdir(site)):
+            record = os.path.join(site, entry, "RECORD")
+            if not entry.endswith(".dist-info") or entry in done or not os.path.isfile(record):
+                continue
+            with open(record, encoding="utf-8") as f:
+                for line in f:
+                    fields = line.rstrip("\n").rsplit(",", 2)
+                    if len(fields) == 3 and fields[0]:
+                        path = os.path.normpath(os.path.join(site, fields[0]))
+                        digest = fields[1][len("sha256="):] if fields[1].startswith("sha256=") else content(path)
+                        saved += link(path, digest) if digest else 0
+            done.add(entry)
+    paths.write_file(done_path, json.dumps(sorted(done)).encode("utf-8"))
+    return saved
+
+
+def sites(venv):
+    lib = os.path.join(venv, "lib")
+    found = []
+    for name in os.listdir(lib) if os.path.isdir(lib) else []:
+        site = os.path.join(lib, name, "site-packages")
+        if os.path.isdir(site):
+            found.append(site)
+    return found
+
+
+def content(path):
+    # A file's hash as RECORD writes it, or None when it cannot be read.
+    try:
+        with open(path, "rb") as f:
+            return base64.urlsafe_b64encode(hashlib.sha256(f.read()).digest()).rstrip(b"=").decode("ascii")
+    except OSError:
+        return None
+
+
+def link(path, digest):
+    # Makes path a hardlink of the store's file with this content; returns
+    # its size when it now shares one.
+    stored = os.path.join(store_dir(), digest[:2], digest)
+    try:
+        if os.path.islink(path) or not os.path.isfile(path):
+            return 0
+        if not os.path.exists(stored):
+            os.makedirs(os.path.dirname(stored), exist_ok=True)
+            os.link(path, stored)
+            return 0
+        if os.path.samefile(path, stored):
+            return 0
+        tmp = path + ".netrunner"
+        os.link(stored, tmp)
+        os.replace(tmp, path)
+        return os.path.getsize(path)
+    except OSError:
+        # Another file system, or a file system without hardlinks: the
+        # venv keeps its own copy.
+        return 0
@@ -0,0 +1,155 @@
+"""A local wheelhouse for the Python requirements of every tool.
+
+`Netrunner wheelhouse` reads the pip installs in the tools' install steps
+(as plan.py finds them), clones the tools that are not installed through
+the mirror cache to read their requirements files, and runs `pip wheel`
+for each tool into .netrunner/wheelhouse/ (or NETRUNNER_WHEELHOUSE), so
+every package is downloaded and built once. wheelhouse.json there records
+which packages and which requirements files, by a hash of their contents,
+were built.
+
+Every `pip install` a step runs then gets `--no-index --find-links
+<wheelhouse>` when the wheelhouse has everything it asks for, and just
+`--find-links` when it has only part of it. The wheelhouse directory can
+be copied to a machine without network access, where tools then install
+from the local disk. NETRUNNER_WHEELHOUSE=off leaves pip alone.
+"""
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from netrunner import executor, paths
+
+MANIFEST = "wheelhouse.json"
+
+
+def wheelhouse_dir():
+    found = os.environ.get("NETRUNNER_WHEELHOUSE")
+    if found == "off":
+        return None
+    return os.path.abspath(found) if found else paths.data_path("wheelhouse")
+
+
+def digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def manifest(directory=None):
+    directory = directory or wheelhouse_dir()
+    try:
+        with open(os.path.join(directory, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError, TypeError):
+        return {"tools": {}}
+
+
+def requirements(install_steps):
+    # (packages, requirements files relative to the tools directory) of
+    # the pip installs among a tool's install steps.
+    from netrunner import plan
+    packages, files = [], []
+    for step in install_steps:
+        if not isinstance(step, str):
+            continue
+        cwd = ""
+        for command in plan.split_commands(step):
+            kind, found = plan.classify(command)
+            if kind == "cd":
+                cwd = os.path.normpath(os.path.join(cwd, found))
+            elif kind == "pip":
+                packages.extend(found[0])
+                files.extend(os.path.normpath(os.path.join(cwd, name)) for name in found[1])
+    return packages, files
+
+
+def collect(spec, install_steps, directory, scratch, log=None):
+    # Builds the wheels of one tool; returns its manifest entry.
+    from netrunner import mirror
+    packages, files = requirements(install_steps)
+    root = paths.tools_dir()
+    if files and spec["dir"] and not os.path.isdir(os.path.join(root, spec["dir"])):
+        # Not installed here: its requirements files come from a checkout.
+        root = scratch
+        if not os.path.isdir(os.path.join(root, spec["dir"])):
+            mirror.clone(spec["repo"], os.path.join(root, spec["dir"]), log=log)
+    present = [name for name in files if os.path.isfile(os.path.join(root, name))]
+    command = [sys.executable, "-m", "pip", "wheel", "--wheel-dir", directory] + packages
+    for name in present:
+        command += ["-r", os.path.join(root, name)]
+    status = 1
+    if packages or present:
+        status = subprocess.call(command, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT if log else None)
+    if len(present) < len(files):
+        status = status or 1
+    return {
+        "packages": packages,
+        "files": {name: digest(os.path.join(root, name)) for name in present},
+        "ok": status == 0,
+        "status": status,
+        "built": time.time(),
+    }
+
+
+def build(jobs, progress=None):
+    # jobs: [(spec, install_steps)]; returns a result per tool.
+    directory = wheelhouse_dir() or paths.data_path("wheelhouse")
+    os.makedirs(directory, exist_ok=True)
+    found = manifest(directory)
+    results = []
+    log_path = paths.data_path("logs", "wheelhouse.log")
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    jobs = [(spec, install_steps) for spec, install_steps in jobs if any(requirements(install_steps))]
+    with tempfile.TemporaryDirectory() as scratch, open(log_path, "a") as log:
+        for spec, install_steps in jobs:
+            start = time.time()
+            log.write("== {0}\n".format(spec["id"]))
+            log.flush()
+            entry = found["tools"][spec["id"]] = collect(spec, install_steps, directory, scratch, log)
+            paths.write_file(os.path.join(directory, MANIFEST), json.dumps(found, indent=1).encode("utf-8"))
+            done = {"tool": spec["id"], "action": "wheelhouse", "ok": entry["ok"], "status": entry["status"],
+                    "seconds": round(time.time() - start, 3), "log": log_path}
+            results.append(done)
+            if progress:
+                progress(done, len(results), len(jobs))
+    return results
+
+
+def covers(found, packages, files):
+    # Whether the tools built into the wheelhouse asked for all of these.
+    have = {name for entry in found["tools"].values() if entry["ok"] for name in entry["packages"]}
+    hashes = {value for entry in found["tools"].values() if entry["ok"] for value in entry["files"].values()}
+    try:
+        return set(packages) <= have and all(digest(name) in hashes for name in files)
+    except OSError:
+        return False
+
+
+def offline(argv, cwd, env=None):
+    # An executor rewrite: a pip install gets the wheelhouse.
+    start = executor.after_sudo(argv)
+    words = argv[start:]
+    if os.path.basename(words[0] if words else "") in ("pip", "pip2", "pip3"):
+        at = start + 1
+    elif words[:1] and os.path.basename(words[0]).startswith("python") and words[1:3] == ["-m", "pip"]:
+        at = start + 3
+    else:
+        return argv
+    while argv[at:at + 1] == ["--python"]:
+        # A venv's pip (see venvs.py).
+        at += 2
+    if argv[at:at + 1] != ["install"]:
+        return argv
+    directory = wheelhouse_dir()
+    if not directory or not os.path.isfile(os.path.join(directory, MANIFEST)):
+        return argv
+    from netrunner import plan
+    found = plan.pip_install(argv[at + 1:])
+    options = ["--find-links", directory]
+    if found and covers(manifest(directory), found[0], [os.path.join(cwd, name) for name in found[1]]):
+        options.insert(0, "--no-index")
+    return argv[:at + 1] + options + argv[at + 1:]
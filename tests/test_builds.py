@@ -0,0 +1,42 @@
+"""Putting what a cached make install installed back into place."""
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from netrunner import builds  # noqa: E402
+
+
+class PlaceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+    def test_target_keeps_its_mode_and_owner(self):
+        # A DESTDIR tree is made by mkdtemp, 0700, and kept so in the cache.
+        tree = tempfile.mkdtemp(prefix="destdir.", dir=self.tmp)
+        os.makedirs(os.path.join(tree, "usr", "local", "bin"))
+        with open(os.path.join(tree, "usr", "local", "bin", "tool"), "w") as f:
+            f.write("#!/bin/sh\n")
+        target = os.path.join(self.tmp, "root")
+        os.makedirs(os.path.join(target, "usr"))
+        os.chmod(target, 0o755)
+        before = os.stat(target)
+        for source in (tree, os.path.join(self.tmp, "cached")):
+            if source != tree:
+                shutil.copytree(tree, source, symlinks=True)
+            subprocess.run(builds.placing(source, target), check=True)
+            after = os.stat(target)
+            self.assertEqual(stat.S_IMODE(after.st_mode), 0o755)
+            self.assertEqual((after.st_uid, after.st_gid), (before.st_uid, before.st_gid))
+            self.assertTrue(os.path.isfile(os.path.join(target, "usr", "local", "bin", "tool")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""Opening screens by their paths."""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from netrunner import catalog, menus  # noqa: E402
+
+STRIKER = ["menu", "info", "striker"]
+
+
+class LinkTest(unittest.TestCase):
+
+    def test_numbers_and_names(self):
+        self.assertEqual(catalog.link("1.11"), STRIKER)
+        self.assertEqual(catalog.link("01.011"), STRIKER)
+        self.assertEqual(catalog.link("info/striker"), STRIKER)
+        self.assertEqual(catalog.link("./1/11/"), STRIKER)
+        self.assertEqual(catalog.link("info"), ["menu", "info"])
+
+    def test_unknown(self):
+        self.assertIsNone(catalog.link("nope"))
+        self.assertIsNone(catalog.link("1.999"))
+
+    def test_back_leaves_the_link(self):
+        # `Netrunner 1.11`, then Back all the way out.
+        shown = []
+
+        def show(name):
+            shown.append(name)
+            return menus.BACK
+
+        with mock.patch.object(menus, "show", show), mock.patch.object(menus.state, "adopt"), \
+                mock.patch.object(menus.jobs, "shutdown"):
+            menus.run("menu", "1.11")
+        self.assertEqual(shown, ["striker", "info", "menu"])
+        self.assertEqual(catalog.link("1.11"), STRIKER)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+"""Steps read into argv lists, what is left to the shell, and sudo."""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from netrunner import executor  # noqa: E402
+
+
+class ParseTest(unittest.TestCase):
+
+    def test_parse(self):
+        self.assertEqual(executor.parse("cd sherlock && sudo python3 sherlock {uname}"),
+                         [(";", ["cd", "sherlock"]), ("&&", ["sudo", "python3", "sherlock", "{uname}"])])
+        self.assertEqual(executor.parse('echo "a b";ls'), [(";", ["echo", "a b"]), (";", ["ls"])])
+
+    def test_parse_leaves_the_shell_its_own(self):
+        for command in ("ls | grep x", "echo $HOME", "make > log", "cd x*/", "export A=1", "sleep 1 &", 'echo "open'):
+            self.assertIsNone(executor.parse(command), command)
+
+    def test_answers_fill_one_argument(self):
+        self.assertEqual(executor.script("echo {x}", {"x": "a b; rm -rf /"}), [(";", ["echo", "a b; rm -rf /"])])
+        self.assertEqual(executor.script("echo {x} | cat", {"x": "y"}), [(";", ["/bin/sh", "-c", "echo y | cat"])])
+
+
+class SudoTest(unittest.TestCase):
+
+    def test_after_sudo(self):
+        self.assertEqual(executor.after_sudo(["pip", "install"]), 0)
+        self.assertEqual(executor.after_sudo(["sudo", "pip"]), 1)
+        self.assertEqual(executor.after_sudo(["sudo", "-H", "-u", "tools", "A=1", "pip"]), 5)
+        self.assertEqual(executor.after_sudo(["sudo", "--", "-weird"]), 2)
+        self.assertEqual(executor.after_sudo(["sudo", "-E"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""The mirror cache against bare repositories served over file://."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from netrunner import mirror  # noqa: E402
+
+
+def git(*args, cwd=None):
+    return subprocess.run(["git", "-c", "user.email=test@example.com", "-c", "user.name=test"] + list(args), cwd=cwd,
+                          check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True).stdout.strip()
+
+
+class MirrorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        environ = mock.patch.dict(os.environ, NETRUNNER_MIRROR_DIR=os.path.join(self.tmp, "mirrors"))
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def repository(self, name):
+        # file:// URL of a bare repository with one commit, and a pull
+        # request ref no mirror should fetch.
+        work = os.path.join(self.tmp, name + "-work")
+        git("init", "-q", "-b", "main", work)
+        with open(os.path.join(work, "tool.py"), "w") as f:
+            f.write("print('hi')\n")
+        git("add", "tool.py", cwd=work)
+        git("commit", "-q", "-m", "first", cwd=work)
+        bare = os.path.join(self.tmp, name + ".git")
+        git("clone", "-q", "--bare", work, bare)
+        git("--git-dir", bare, "update-ref", "refs/pull/1/head", "HEAD")
+        return "file://" + bare
+
+    def checkout(self, name):
+        return os.path.join(self.tmp, name)
+
+    def mirror_path(self, url, kind):
+        return os.path.join(mirror.mirror_dir(), mirror.key(url, kind) + ".git")
+
+    def test_clone(self):
+        for kind in mirror.OPTIONS:
+            # A repository each: a full mirror would serve the others.
+            url = self.repository("tool-" + kind)
+            target = self.checkout("tool-" + kind)
+            self.assertEqual(mirror.clone(url, target, kind), 0)
+            self.assertTrue(os.path.isfile(os.path.join(target, "tool.py")))
+            self.assertEqual(git("-C", target, "config", "remote.origin.url"), url)
+            refs = git("--git-dir", self.mirror_path(url, kind), "for-each-ref", "--format=%(refname)").split()
+            self.assertEqual(refs, ["refs/heads/main"])
+
+    def test_clone_into_its_own_checkout(self):
+        # A clone cut short before its checkout is finished, and one that
+        # is complete keeps what was changed in it.
+        url = self.repository("tool")
+        target = self.checkout("tool")
+        git("clone", "-q", "--no-checkout", url, target)
+        self.assertEqual(mirror.clone(url, target, "full"), 0)
+        self.assertTrue(os.path.isfile(os.path.join(target, "tool.py")))
+        with open(os.path.join(target, "tool.py"), "w") as f:
+            f.write("edited\n")
+        self.assertEqual(mirror.clone(url, target, "full"), 0)
+        with open(os.path.join(target, "tool.py")) as f:
+            self.assertEqual(f.read(), "edited\n")
+
+    def test_clone_cut_short(self):
+        # Still pointing at the mirror: made again.
+        url = self.repository("tool")
+        self.assertEqual(mirror.clone(url, self.checkout("first"), "full"), 0)
+        target = self.checkout("tool")
+        git("clone", "-q", "--no-checkout", self.mirror_path(url, "full"), target)
+        self.assertEqual(mirror.clone(url, target, "full"), 0)
+        self.assertEqual(git("-C", target, "config", "remote.origin.url"), url)
+        self.assertTrue(os.path.isfile(os.path.join(target, "tool.py")))
+
+    def test_offline_reuse(self):
+        url = self.repository("tool")
+        self.assertEqual(mirror.clone(url, self.checkout("first"), "full"), 0)
+        # The upstream is gone: a warm mirror still serves clones, within
+        # its TTL and after it, when the fetch fails.
+        os.rename(url[len("file://"):], os.path.join(self.tmp, "gone.git"))
+        self.assertEqual(mirror.clone(url, self.checkout("second"), "full"), 0)
+        with mock.patch.object(mirror, "TTL", -1):
+            self.assertEqual(mirror.clone(url, self.checkout("third"), "full"), 0)
+        self.assertTrue(os.path.isfile(os.path.join(self.checkout("third"), "tool.py")))
+
+    def test_evict(self):
+        urls = [self.repository("one"), self.repository("two")]
+        for url in urls:
+            self.assertEqual(mirror.clone(url, self.checkout(mirror.checkout_name(url)), "full"), 0)
+        self.assertTrue(all(info["bytes"] for name, info, used in mirror.mirrors()))
+        # A mirror in use stays, the other one goes.
+        with mirror.locked(mirror.key(urls[0])):
+            mirror.evict(0)
+        self.assertTrue(os.path.isdir(self.mirror_path(urls[0], "full")))
+        self.assertFalse(os.path.exists(self.mirror_path(urls[1], "full")))
+        mirror.evict(0)
+        self.assertEqual(mirror.mirrors(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Install steps read into the nodes of a plan."""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from netrunner import plan  # noqa: E402
+
+
+class ClassifyTest(unittest.TestCase):
+
+    def test_split_commands(self):
+        self.assertEqual(plan.split_commands("a; b && 'c; d' &&e"), ["a", "b", "'c; d'", "e"])
+        self.assertEqual(plan.split_commands(" ; "), [])
+
+    def test_classify(self):
+        self.assertEqual(plan.classify("cd nmap"), ("cd", "nmap"))
+        self.assertEqual(plan.classify("sudo apt-get install -y nmap git"), ("apt", ["nmap", "git"]))
+        self.assertEqual(plan.classify("apt update"), ("apt-update", None))
+        self.assertEqual(plan.classify("sudo add-apt-repository ppa:x/y"), ("apt-repository", "ppa:x/y"))
+        self.assertEqual(plan.classify("pip3 install -r requirements.txt six"), ("pip", (["six"], ["requirements.txt"])))
+        self.assertEqual(plan.classify("python3 -m pip install -q six"), ("pip", (["six"], [])))
+        self.assertEqual(plan.classify("pip install --user six"), ("shell", None))
+        self.assertEqual(plan.classify("git clone https://example.com/a.git"), ("clone", None))
+        self.assertEqual(plan.classify("echo 'unclosed"), ("shell", None))
+
+
+class PlacedTest(unittest.TestCase):
+
+    def test_placed(self):
+        # Each command with the cd it runs in, as a checkpoint marks it.
+        self.assertEqual(plan.placed("sudo chmod -R 755 nmap && cd nmap && ./configure && make"),
+                         ["sudo chmod -R 755 nmap", "cd nmap && ./configure", "cd nmap && make"])
+        self.assertEqual(plan.placed("cd a && cd b && make"), ["cd a/b && make"])
+        self.assertEqual(plan.placed("make || true"), ["make || true"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,48 +6,18 @@ echo "██║╚████║██╔══╝░░░░░██║░
 echo "██║░╚███║███████╗░░░██║░░░██║░░██║╚██████╔╝██║░╚███║██║░╚███║███████╗██║░░██║";
 echo "╚═╝░░╚══╝╚══════╝░░░╚═╝░░░╚═╝░░╚═╝░╚═════╝░╚═╝░░╚══╝╚═╝░░╚══╝╚══════╝╚═╝░░╚═╝";
 
-clear
-
-sudo chmod +x /etc/
-
-clear
-
-sudo chmod +x /usr/share/doc
-
-clear
-
-sudo rm -rf /usr/share/doc/Netrunner/
-
-clear
-
-cd /etc/
-
-clear
-
-sudo rm -rf /etc/Netrunner
-
-clear
-
-mkdir Netrunner
-
-clear
-
-cd Netrunner
-
-clear
-
-git clone https://github.com/MiChaelinzo/CyberPunkNetrunner.git
-
-clear
-
-cd Netrunner
-
-clear
-
-sudo chmod +x install.sh
-
-clear
-
-./install.sh
-
-clear
+# Netrunner updates itself into a new versioned directory under
+# /opt/Netrunner and switches to it only once it is ready, so the
+# installed version keeps working if anything fails. "./update.sh
+# --rollback" goes back to the version before the last update.
+ROOT_DIR="/opt/Netrunner"
+
+if [ -d "$ROOT_DIR/current" ]; then
+    cd "$(readlink -f "$ROOT_DIR/current")" && python3 -m netrunner.selfupdate "$@"
+else
+    # First update from an install made before versioned directories.
+    TMP_DIR=$(mktemp -d)
+    git clone --depth 1 https://github.com/MiChaelinzo/CyberPunkNetrunner.git "$TMP_DIR" &&
+        (cd "$TMP_DIR" && NETRUNNER_SOURCE="$TMP_DIR" python3 -m netrunner.selfupdate)
+    rm -rf "$TMP_DIR"
+fi